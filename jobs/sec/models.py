@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterable, List, Dict, Any
 import json
 
 
@@ -247,7 +247,7 @@ class Watchlist:
         )
 
     @classmethod
-    def from_tickers(cls, tickers: List[str]) -> "Watchlist":
+    def from_tickers(cls, tickers: Iterable[str]) -> "Watchlist":
         """Create watchlist from list of ticker symbols."""
         return cls(
             companies=[Company(ticker=t.upper().strip()) for t in tickers if t.strip()]
@@ -6,6 +6,7 @@ Produces two artifact sets per filing:
 A) Display output (HTML-first) - for UI rendering:
    - display/raw_primary.html     : Original as-filed HTML
    - display/sections/{id}.html   : Sanitized per-section HTML
+     (or display/sections.zip       : same files in one archive, opt-in)
    - display/manifest.json        : TOC, metadata, stats, anchor map
    - display/anchors.json         : Stable anchor IDs for citations
 
@@ -20,8 +21,11 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import re
+import zipfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -41,6 +45,12 @@ try:
 except ImportError:
     HAS_BLEACH = False
 
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,6 +110,91 @@ SECTION_10Q_PATTERNS = [
     (r"item\s*6[.:]*\s*exhibits", "item_6", "Item 6. Exhibits"),
 ]
 
+# Uppercase letter starting a whitespace-delimited word (Title Case anchor test)
+_CAPS_WORD_RE = re.compile(r'(?<!\S)[A-Z]')
+
+# Patterns used per section / per anchor candidate, compiled once at import.
+# Searches take a start (and end) position rather than slicing the filing,
+# so probing a multi-MB document does not copy its tail for every pattern.
+_TAG_RE = re.compile(r'<[^>]+>')
+_HSPACE_RUN_RE = re.compile(r'[ \t]+')
+_SPACE_BEFORE_NEWLINE_RE = re.compile(r' +\n')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# TOC detection (_is_toc_region); applied to lowercased text
+_TOC_ITEM_RE = re.compile(r'item\s+(\d+[a-c]?)', re.IGNORECASE)
+_TOC_PART_RE = re.compile(r'part\s+([ivx]+|\d+)', re.IGNORECASE)
+_TOC_PAGE_NUMBER_RE = re.compile(r'(?:page\s*)?(\d{1,3})\s*(?:\n|$)')
+_DOTTED_LEADER_RE = re.compile(r'\.{3,}')
+
+# Next "Item N" / "Part N" header (_has_prose_following)
+_NEXT_HEADER_RE = re.compile(r'(item\s+\d+[a-c]?[.:]*\s*\w|part\s+[ivx]+[.:]*\s*\w)', re.IGNORECASE)
+
+# Section header tags when walking back from a text anchor (_extract_section_html)
+_HTML_ITEM_HEADER_RE = re.compile(r'>\s*(ITEM\s+\d+[A-C]?\.?)', re.IGNORECASE)
+
+# Section end boundaries, in priority order (_find_section_end_boundary)
+_SECTION_END_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # Item patterns with required content indicators
+    r'>\s*Item\s+\d+[A-C]?\s*[.:]\s*[A-Z][a-z]',  # "Item 1. Business"
+    r'>\s*ITEM\s+\d+[A-C]?\s*[.:]\s*[A-Z]',  # "ITEM 1. BUSINESS"
+    # Part patterns
+    r'>\s*PART\s+I{1,3}V?\s*[.:\-—]',  # "PART I." or "PART II -"
+    r'>\s*Part\s+I{1,3}V?\s*[.:\-—]',
+    # Document end markers
+    r'>\s*SIGNATURES?\s*<',
+    r'>\s*EXHIBIT\s+INDEX\s*<',
+))
+_STRUCTURAL_BREAK_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'<hr[^>]*>',
+    r'</body>',
+    r'<div[^>]*page-break',
+))
+
+# Anchor candidates (_find_anchors): ALL CAPS and Title Case header lines
+_CAPS_HEADER_RE = re.compile(r'\n\s*([A-Z][A-Z0-9\s\-—–,.:;\'\"()]{5,60})\s*\n')
+_TITLE_HEADER_RE = re.compile(r'\n\s*([A-Z][a-zA-Z0-9\s\-—–,.:;\'\"()]{5,60})\s*\n')
+
+# Labels that are not real headers (_is_valid_anchor_label); matched at the
+# start of the lowercased, stripped label
+_GARBAGE_LABEL_RE = re.compile(
+    r'\s*\d+\s*$'  # Just numbers
+    r'|page\s+\d+'  # Page numbers
+    r'|\s*\$[\d,.\s]+$'  # Dollar amounts
+    r'|[,.\s\-—–]+$'  # Just punctuation
+    r'|\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}'  # Dates
+    r'|(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d',  # Month dates
+    re.IGNORECASE,
+)
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Table extraction (_extract_tables / _extract_cell_text)
+_TABLE_RE = re.compile(r'<table[^>]*>(.*?)</table>', re.IGNORECASE | re.DOTALL)
+_CAPTION_RE = re.compile(r'<caption[^>]*>(.*?)</caption>', re.IGNORECASE | re.DOTALL)
+_THEAD_RE = re.compile(r'<thead[^>]*>(.*?)</thead>', re.IGNORECASE | re.DOTALL)
+_TH_RE = re.compile(r'<th[^>]*>(.*?)</th>', re.IGNORECASE | re.DOTALL)
+_TBODY_RE = re.compile(r'<tbody[^>]*>(.*?)</tbody>', re.IGNORECASE | re.DOTALL)
+_TR_RE = re.compile(r'<tr[^>]*>(.*?)</tr>', re.IGNORECASE | re.DOTALL)
+_CELL_RE = re.compile(r'<(td|th)[^>]*>(.*?)</\1>', re.IGNORECASE | re.DOTALL)
+_TH_OPEN_RE = re.compile(r'<th', re.IGNORECASE)
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_SUP_RE = re.compile(r'<sup[^>]*>.*?</sup>', re.IGNORECASE | re.DOTALL)
+_SUB_RE = re.compile(r'<sub[^>]*>.*?</sub>', re.IGNORECASE | re.DOTALL)
+_NEWLINE_PADDING_RE = re.compile(r' *\n *')
+
+
+@lru_cache(maxsize=256)
+def _section_pattern(pattern: str) -> re.Pattern:
+    """Compile a SECTION_*_PATTERNS entry (case-insensitive, multiline)."""
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _label_pattern(label: str) -> re.Pattern:
+    """Compile a section label into a case-insensitive, whitespace-flexible pattern."""
+    return re.compile(re.escape(label).replace(r'\ ', r'\s*'), re.IGNORECASE)
+
 
 # =============================================================================
 # HTML Processing
@@ -179,14 +274,25 @@ class HTMLSanitizer:
         return html_content
 
 
+# Text extractors selectable on FilingParserV2. Their output differs on
+# markup that relies on implied or self-closed tags (see LxmlTextExtractor),
+# which shifts section offsets and chunks, so lxml is opt-in rather than
+# picked up whenever it happens to be installed.
+TEXT_EXTRACTORS = ("html.parser", "lxml")
+
+# Text extraction: content of skip tags is dropped, block tags emit newlines
+_SKIP_TEXT_TAGS = frozenset({'script', 'style', 'head', 'meta', 'link'})
+_BLOCK_TEXT_TAGS = frozenset({'p', 'div', 'br', 'tr', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'td', 'th'})
+
+
 class HTMLTextExtractor(HTMLParser):
     """Extract plain text from HTML, preserving structure."""
 
     def __init__(self):
         super().__init__()
         self.result = StringIO()
-        self.skip_tags = {'script', 'style', 'head', 'meta', 'link'}
-        self.block_tags = {'p', 'div', 'br', 'tr', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'td', 'th'}
+        self.skip_tags = _SKIP_TEXT_TAGS
+        self.block_tags = _BLOCK_TEXT_TAGS
         self.skip_content = False
         self.tag_stack = []
 
@@ -215,11 +321,82 @@ class HTMLTextExtractor(HTMLParser):
         return self.result.getvalue()
 
 
+class LxmlTextExtractor:
+    """Extract plain text from HTML with libxml2 (lxml).
+
+    Tokenizing runs in C and only element/text events reach Python, instead
+    of html.parser's Python-level scanning of every tag. Same
+    feed()/get_text() API and skip/block rules as HTMLTextExtractor, used by
+    FilingParserV2(text_extractor="lxml").
+
+    Output matches HTMLTextExtractor for well-formed markup, but libxml2
+    reports the tree it builds rather than the tags as written:
+    - a self-closed <br/> yields one newline (html.parser: two)
+    - unclosed <p>, <td>, <li> etc. get implied end events, each adding
+      a newline where html.parser adds none
+    - stray end tags are dropped (html.parser emits a newline for a stray
+      block end tag)
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._skip_depth = 0
+
+    def feed(self, html_content: str) -> None:
+        # huge_tree lifts libxml2's size limits, which large filings exceed
+        parser = lxml_etree.HTMLParser(target=self, huge_tree=True)
+        parser.feed(html_content)
+        parser.close()
+
+    # lxml parser target callbacks
+
+    def start(self, tag, attrib) -> None:
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+        if tag in _BLOCK_TEXT_TAGS:
+            self._parts.append('\n')
+
+    def end(self, tag) -> None:
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth -= 1
+        # libxml2 reports an end for void <br>; html.parser does not
+        if tag in _BLOCK_TEXT_TAGS and tag != 'br':
+            self._parts.append('\n')
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def close(self) -> None:
+        pass
+
+    def get_text(self) -> str:
+        return ''.join(self._parts)
+
+
+def _document_tables(html_content: str) -> Tuple[Tuple[str, str, str], ...]:
+    """Tokenize the <table> elements of a filing.
+
+    Every section that falls back to text-to-HTML conversion searches the
+    same filing's tables, so parse() runs this once and passes the result down.
+
+    Returns:
+        (table_html, tag-stripped text, whitespace-normalized lowercase text)
+        for each table in document order
+    """
+    tables = []
+    for table_html in re.findall(r'<table[^>]*>.*?</table>', html_content, re.IGNORECASE | re.DOTALL):
+        table_text = _TAG_RE.sub(' ', table_html)
+        normalized = _WHITESPACE_RUN_RE.sub(' ', table_text).lower()
+        tables.append((table_html, table_text, normalized))
+    return tuple(tables)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Anchor:
     """A navigable anchor point in the document."""
     id: str              # Stable ID (e.g., "item_1a_risk_macroeconomic")
@@ -229,7 +406,7 @@ class Anchor:
     html_offset: int     # Position in section HTML (for highlighting)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section of the filing with both HTML and text versions."""
     id: str
@@ -262,7 +439,7 @@ class Section:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A text chunk for RAG with stable anchor reference."""
     id: str              # Unique chunk ID
@@ -284,7 +461,7 @@ class Chunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """An extracted table for structured Q&A."""
     id: str
@@ -304,7 +481,7 @@ class Table:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFiling:
     """Complete parsed filing with display and RAG artifacts."""
     filing_id: str
@@ -332,9 +509,23 @@ class FilingParserV2:
         self,
         chunk_size: int = 800,
         chunk_overlap: int = 150,
+        text_extractor: str = "html.parser",
     ):
+        """
+        Args:
+            text_extractor: "html.parser" or "lxml" (faster, needs lxml; text
+                differs on malformed markup, see LxmlTextExtractor)
+        """
+        if text_extractor not in TEXT_EXTRACTORS:
+            raise ValueError(
+                f"Unknown text_extractor '{text_extractor}', expected one of {TEXT_EXTRACTORS}"
+            )
+        if text_extractor == "lxml" and not HAS_LXML:
+            logger.warning("lxml not installed, extracting text with html.parser")
+            text_extractor = "html.parser"
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.text_extractor = text_extractor
         self.sanitizer = HTMLSanitizer()
 
     def parse(
@@ -377,7 +568,9 @@ class FilingParserV2:
         if not sections:
             text = self._extract_text(html_content)
             section_positions = self._find_section_positions(text, patterns)
-            sections = self._extract_sections(html_content, text, section_positions)
+            sections = self._extract_sections(
+                html_content, text, section_positions, _document_tables(html_content)
+            )
 
         # Find anchors within sections
         for section in sections:
@@ -409,19 +602,22 @@ class FilingParserV2:
 
     def _extract_text(self, html_content: str) -> str:
         """Extract clean text from HTML."""
-        parser = HTMLTextExtractor()
+        if self.text_extractor == "lxml":
+            parser = LxmlTextExtractor()
+        else:
+            parser = HTMLTextExtractor()
         try:
             parser.feed(html_content)
             text = parser.get_text()
         except Exception as e:
             logger.warning(f"HTML parsing error: {e}")
-            text = re.sub(r'<[^>]+>', ' ', html_content)
+            text = _TAG_RE.sub(' ', html_content)
 
         # Clean whitespace while preserving newlines
         text = text.replace('\r\n', '\n').replace('\r', '\n')
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r' +\n', '\n', text)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _HSPACE_RUN_RE.sub(' ', text)
+        text = _SPACE_BEFORE_NEWLINE_RE.sub('\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         return text.strip()
 
     def _is_toc_region(self, text: str, pos: int, window: int = 1500) -> bool:
@@ -439,11 +635,8 @@ class FilingParserV2:
         region = text[start:end].lower()
 
         # Signal 1: Count distinct item/part references in the region
-        item_pattern = r'item\s+(\d+[a-c]?)'
-        part_pattern = r'part\s+([ivx]+|\d+)'
-
-        item_matches = set(re.findall(item_pattern, region, re.IGNORECASE))
-        part_matches = set(re.findall(part_pattern, region, re.IGNORECASE))
+        item_matches = set(_TOC_ITEM_RE.findall(region))
+        part_matches = set(_TOC_PART_RE.findall(region))
         total_distinct = len(item_matches) + len(part_matches)
 
         # Signal 2: Check for explicit TOC indicators
@@ -456,12 +649,11 @@ class FilingParserV2:
 
         # Signal 3: Check for page number patterns (common in TOC)
         # Patterns like "... 1", "... 12", "page 1", etc. at end of lines
-        page_number_pattern = r'(?:page\s*)?(\d{1,3})\s*(?:\n|$)'
-        page_numbers = re.findall(page_number_pattern, region)
+        page_numbers = _TOC_PAGE_NUMBER_RE.findall(region)
         has_many_page_numbers = len(page_numbers) >= 5
 
         # Signal 4: Check for dotted leader lines (... or ....) common in TOC
-        dotted_leaders = len(re.findall(r'\.{3,}', region))
+        dotted_leaders = len(_DOTTED_LEADER_RE.findall(region))
         has_dotted_leaders = dotted_leaders >= 3
 
         # Decision logic:
@@ -483,22 +675,16 @@ class FilingParserV2:
         Returns True if there are at least min_chars of text before the next
         section header pattern, indicating actual content rather than just ToC entries.
         """
-        # Look at the text following this position
-        following = text[pos:pos + min_chars + 200].lower()
-
-        # Find the next header pattern
-        next_header = re.search(
-            r'(item\s+\d+[a-c]?[.:]*\s*\w|part\s+[ivx]+[.:]*\s*\w)',
-            following,
-            re.IGNORECASE
-        )
+        # Find the next header pattern in the window following this position
+        # (searched in place: no slice or lowercased copy of the window)
+        next_header = _NEXT_HEADER_RE.search(text, pos, pos + min_chars + 200)
 
         if next_header is None:
             # No next header found in window - likely has prose
             return True
 
         # Check if there's enough content before the next header
-        chars_before_next = next_header.start()
+        chars_before_next = next_header.start() - pos
         return chars_before_next >= min_chars
 
     def _find_section_positions(
@@ -516,7 +702,7 @@ class FilingParserV2:
         matches = []
 
         for pattern, section_id, label in patterns:
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+            for match in _section_pattern(pattern).finditer(text_lower):
                 matches.append({
                     "id": section_id,
                     "label": label,
@@ -567,8 +753,16 @@ class FilingParserV2:
         html_content: str,
         text: str,
         positions: List[Dict[str, Any]],
+        document_tables: Optional[Tuple[Tuple[str, str, str], ...]] = None,
     ) -> List[Section]:
-        """Extract sections with both HTML and text."""
+        """Extract sections with both HTML and text.
+
+        Args:
+            document_tables: _document_tables(html_content), computed by the
+                caller so all sections share one table scan
+        """
+        if document_tables is None:
+            document_tables = _document_tables(html_content)
         sections = []
         text_len = len(text)
 
@@ -584,7 +778,7 @@ class FilingParserV2:
             # Try to find corresponding HTML section
             # Use section label to locate in HTML
             section_html = self._extract_section_html(
-                html_content, pos["label"], section_text, next_section
+                html_content, pos["label"], section_text, next_section, document_tables
             )
 
             section = Section(
@@ -627,7 +821,7 @@ class FilingParserV2:
         # Build regex patterns for matching section headers
         compiled_patterns = []
         for pattern, section_id, label in patterns:
-            compiled_patterns.append((re.compile(pattern, re.IGNORECASE | re.MULTILINE), section_id, label))
+            compiled_patterns.append((_section_pattern(pattern), section_id, label))
 
         # Find all text nodes and their parent elements that match section patterns
         # Track traversal index to preserve document order after deduplication
@@ -756,6 +950,7 @@ class FilingParserV2:
         label: str,
         section_text: str,
         next_section: Optional[Dict[str, Any]] = None,
+        document_tables: Optional[Tuple[Tuple[str, str, str], ...]] = None,
     ) -> str:
         """Extract and sanitize HTML for a section.
 
@@ -769,12 +964,11 @@ class FilingParserV2:
             label: Section label (e.g., "Item 1. Business")
             section_text: Extracted text content of this section
             next_section: Info about the next section for end-boundary detection
+            document_tables: Tables of html_content for the fallback (scanned
+                here if not given)
         """
         # Strategy 1: Find section in HTML by label
-        escaped_label = re.escape(label).replace(r'\ ', r'\s*')
-        pattern = re.compile(escaped_label, re.IGNORECASE)
-
-        matches = list(pattern.finditer(html_content))
+        matches = list(_label_pattern(label).finditer(html_content))
 
         best_start = None
         best_content_len = 0
@@ -795,7 +989,7 @@ class FilingParserV2:
 
             for line in lines[1:15]:  # Look at lines 2-15 (skip header)
                 # Clean line for matching (remove excess whitespace)
-                anchor = re.sub(r'\s+', ' ', line)[:80]
+                anchor = _WHITESPACE_RUN_RE.sub(' ', line)[:80]
                 if len(anchor) >= 30:  # Need substantial text
                     # Create a flexible pattern (allow for HTML tags within text)
                     # Insert (?:<[^>]*>|\s)* between words to allow tags
@@ -808,18 +1002,10 @@ class FilingParserV2:
                             search_region = html_content[max(0, anchor_match.start() - 3000):anchor_match.start()]
 
                             # Look for the section header pattern (e.g., "ITEM 2" or "Item 2")
-                            header_patterns = [
-                                r'>\s*(ITEM\s+\d+[A-C]?\.?)',
-                                r'>\s*(Item\s+\d+[A-C]?\.?)',
-                            ]
-
                             header_pos = None
-                            for hp in header_patterns:
-                                hm = list(re.finditer(hp, search_region, re.IGNORECASE))
-                                if hm:
-                                    # Use the last match (closest to anchor)
-                                    header_pos = hm[-1].start()
-                                    break
+                            for hm in _HTML_ITEM_HEADER_RE.finditer(search_region):
+                                # Keep the last match (closest to anchor)
+                                header_pos = hm.start()
 
                             if header_pos is not None:
                                 # Walk back a bit more to get the opening div/span
@@ -840,7 +1026,7 @@ class FilingParserV2:
 
         if best_start is None:
             # Fallback: convert text to HTML, but try to preserve tables from original
-            return self._text_to_html_with_tables(section_text, html_content)
+            return self._text_to_html_with_tables(section_text, html_content, document_tables)
 
         # Find end boundary using next section info
         end = self._find_section_end_boundary(
@@ -874,14 +1060,9 @@ class FilingParserV2:
 
         # Strategy 1: Find next section by its label (most reliable)
         if next_section and next_section.get("label"):
-            next_label = next_section["label"]
-            # Create flexible pattern for next section label
-            escaped_next = re.escape(next_label).replace(r'\ ', r'\s*')
-            next_label_pattern = re.compile(escaped_next, re.IGNORECASE)
-
-            for m in next_label_pattern.finditer(html_content[search_from:]):
+            for m in _label_pattern(next_section["label"]).finditer(html_content, search_from):
                 # Verify this isn't a ToC reference by checking surrounding context
-                match_pos = search_from + m.start()
+                match_pos = m.start()
                 context_before = html_content[max(0, match_pos - 200):match_pos].lower()
 
                 # Skip if this looks like a ToC entry (has many other Item references nearby)
@@ -897,29 +1078,17 @@ class FilingParserV2:
 
         # Strategy 2: Comprehensive section header patterns
         # These patterns match section headers in the actual content (not ToC)
-        section_patterns = [
-            # Item patterns with required content indicators
-            r'>\s*Item\s+\d+[A-C]?\s*[.:]\s*[A-Z][a-z]',  # "Item 1. Business"
-            r'>\s*ITEM\s+\d+[A-C]?\s*[.:]\s*[A-Z]',  # "ITEM 1. BUSINESS"
-            # Part patterns
-            r'>\s*PART\s+I{1,3}V?\s*[.:\-—]',  # "PART I." or "PART II -"
-            r'>\s*Part\s+I{1,3}V?\s*[.:\-—]',
-            # Document end markers
-            r'>\s*SIGNATURES?\s*<',
-            r'>\s*EXHIBIT\s+INDEX\s*<',
-        ]
-
         end = len(html_content)
 
-        for pattern in section_patterns:
-            match = re.search(pattern, html_content[search_from:], re.IGNORECASE)
+        for pattern in _SECTION_END_RES:
+            match = pattern.search(html_content, search_from)
             if match:
-                candidate_end = search_from + match.start()
+                candidate_end = match.start()
 
                 # Verify this is a real section boundary (not just a reference)
                 # Check that there's substantial content between start and this point
                 content_between = html_content[start_pos:candidate_end]
-                text_content = re.sub(r'<[^>]+>', ' ', content_between)
+                text_content = _TAG_RE.sub(' ', content_between)
                 word_count = len(text_content.split())
 
                 # Only accept if we have reasonable content
@@ -940,15 +1109,10 @@ class FilingParserV2:
         if end > max_reasonable_end and max_reasonable_end < len(html_content):
             # We might be capturing too much - try to find a better boundary
             # Look for any major structural break
-            structural_breaks = [
-                r'<hr[^>]*>',
-                r'</body>',
-                r'<div[^>]*page-break',
-            ]
-            for pattern in structural_breaks:
-                match = re.search(pattern, html_content[search_from:max_reasonable_end], re.IGNORECASE)
+            for pattern in _STRUCTURAL_BREAK_RES:
+                match = pattern.search(html_content, search_from, max_reasonable_end)
                 if match:
-                    end = min(end, search_from + match.start())
+                    end = min(end, match.start())
                     break
 
         # Final safeguard: never return document end without a warning
@@ -964,14 +1128,24 @@ class FilingParserV2:
 
         return end
 
-    def _text_to_html_with_tables(self, text: str, original_html: str) -> str:
+    def _text_to_html_with_tables(
+        self,
+        text: str,
+        original_html: str,
+        document_tables: Optional[Tuple[Tuple[str, str, str], ...]] = None,
+    ) -> str:
         """Convert text to HTML, attempting to preserve tables from original HTML.
 
         For sections with tabular data, try to extract actual <table> elements
         from the original HTML based on table content matching.
+
+        Args:
+            document_tables: _document_tables(original_html), if already computed
         """
         # Check if original HTML has tables
-        tables_in_html = re.findall(r'<table[^>]*>.*?</table>', original_html, re.IGNORECASE | re.DOTALL)
+        if document_tables is None:
+            document_tables = _document_tables(original_html)
+        tables_in_html = document_tables
 
         if not tables_in_html:
             # No tables to preserve, use simple conversion
@@ -990,26 +1164,22 @@ class FilingParserV2:
             table_match = None
             if line and len(line) < 100:  # Potential table caption/header
                 # Look for a table that contains this text
-                for j, table_html in enumerate(tables_in_html):
+                needle = line[:30].lower()
+                for j, (table_html, table_text, normalized) in enumerate(tables_in_html):
                     if j in used_tables:
                         continue
-                    # Extract text from table
-                    table_text = re.sub(r'<[^>]+>', ' ', table_html)
-                    table_text = re.sub(r'\s+', ' ', table_text)
-
                     # Check if line content appears in table
-                    if line[:30].lower() in table_text.lower():
-                        table_match = (j, table_html)
+                    if needle in normalized:
+                        table_match = (j, table_html, table_text)
                         break
 
             if table_match:
-                j, table_html = table_match
+                j, table_html, table_text = table_match
                 used_tables.add(j)
                 # Sanitize and add table
                 sanitized_table = self.sanitizer.sanitize(table_html)
                 result_parts.append(sanitized_table)
                 # Skip lines that are part of the table content
-                table_text = re.sub(r'<[^>]+>', ' ', table_html)
                 table_lines = [l.strip() for l in table_text.split('\n') if l.strip()]
                 # Skip similar lines in source text
                 skip_count = 0
@@ -1041,7 +1211,7 @@ class FilingParserV2:
         text = section.text
 
         # Pattern 1: ALL CAPS headers
-        for match in re.finditer(r'\n\s*([A-Z][A-Z0-9\s\-—–,.:;\'\"()]{5,60})\s*\n', text):
+        for match in _CAPS_HEADER_RE.finditer(text):
             label = match.group(1).strip()
             if label.upper() == label and label not in seen:
                 # Filter garbage labels
@@ -1058,10 +1228,10 @@ class FilingParserV2:
                 ))
 
         # Pattern 2: Title Case headers
-        for match in re.finditer(r'\n\s*([A-Z][a-zA-Z0-9\s\-—–,.:;\'\"()]{5,60})\s*\n', text):
+        for match in _TITLE_HEADER_RE.finditer(text):
             label = match.group(1).strip()
             words = label.split()
-            caps_words = sum(1 for w in words if w and w[0].isupper())
+            caps_words = len(_CAPS_WORD_RE.findall(label))
             if len(words) >= 2 and caps_words >= 2 and label not in seen:
                 # Filter garbage labels
                 if not self._is_valid_anchor_label(label):
@@ -1087,7 +1257,8 @@ class FilingParserV2:
         - Common non-header patterns (dates, page numbers, etc.)
         """
         # Must have at least 3 alphabetic characters
-        alpha_chars = sum(1 for c in label if c.isalpha())
+        # map() dispatches str.isalpha in C rather than via a generator
+        alpha_chars = sum(map(str.isalpha, label))
         if alpha_chars < 3:
             return False
 
@@ -1095,26 +1266,14 @@ class FilingParserV2:
         if alpha_chars / len(label) < 0.3:
             return False
 
-        # Filter out common garbage patterns
-        garbage_patterns = [
-            r'^\s*\d+\s*$',  # Just numbers
-            r'^page\s+\d+',  # Page numbers
-            r'^\s*\$[\d,.\s]+$',  # Dollar amounts
-            r'^[,.\s\-—–]+$',  # Just punctuation
-            r'^\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}',  # Dates
-            r'^(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d',  # Month dates
-        ]
-        label_lower = label.lower().strip()
-        for pattern in garbage_patterns:
-            if re.match(pattern, label_lower, re.IGNORECASE):
-                return False
-
-        return True
+        # Filter out common garbage patterns (numbers, page numbers, dollar
+        # amounts, punctuation, dates)
+        return _GARBAGE_LABEL_RE.match(label.lower().strip()) is None
 
     def _make_anchor_id(self, section_id: str, label: str) -> str:
         """Generate stable, collision-proof anchor ID from section and label."""
         # Normalize label to create slug
-        slug = re.sub(r'[^a-z0-9]+', '_', label.lower()).strip('_')[:20]
+        slug = _SLUG_SEPARATOR_RE.sub('_', label.lower()).strip('_')[:20]
         # Add hash suffix to prevent collisions
         hash_suffix = hashlib.sha1(label.encode()).hexdigest()[:8]
         return f"{section_id}_{slug}_{hash_suffix}"
@@ -1175,38 +1334,38 @@ class FilingParserV2:
 
         for section in sections:
             # Find tables in section HTML
-            for match in re.finditer(r'<table[^>]*>(.*?)</table>', section.html, re.IGNORECASE | re.DOTALL):
+            for match in _TABLE_RE.finditer(section.html):
                 table_html = match.group(0)
 
                 # Extract caption
-                caption_match = re.search(r'<caption[^>]*>(.*?)</caption>', table_html, re.IGNORECASE | re.DOTALL)
+                caption_match = _CAPTION_RE.search(table_html)
                 caption = self._extract_cell_text(caption_match.group(1)) if caption_match else None
 
                 # Extract headers from <thead> or first row with <th> cells
                 headers = []
-                header_match = re.search(r'<thead[^>]*>(.*?)</thead>', table_html, re.IGNORECASE | re.DOTALL)
+                header_match = _THEAD_RE.search(table_html)
                 if header_match:
                     # Get headers from thead
-                    for th in re.finditer(r'<th[^>]*>(.*?)</th>', header_match.group(1), re.IGNORECASE | re.DOTALL):
+                    for th in _TH_RE.finditer(header_match.group(1)):
                         headers.append(self._extract_cell_text(th.group(1)))
 
                 # Extract rows - handle both <td> and <th> cells
                 rows = []
                 # Find tbody if present, otherwise use whole table
-                tbody_match = re.search(r'<tbody[^>]*>(.*?)</tbody>', table_html, re.IGNORECASE | re.DOTALL)
+                tbody_match = _TBODY_RE.search(table_html)
                 table_body = tbody_match.group(1) if tbody_match else table_html
 
-                for tr in re.finditer(r'<tr[^>]*>(.*?)</tr>', table_body, re.IGNORECASE | re.DOTALL):
+                for tr in _TR_RE.finditer(table_body):
                     row_html = tr.group(1)
                     row = []
 
                     # Extract cells - both <td> and <th> in order of appearance
-                    for cell in re.finditer(r'<(td|th)[^>]*>(.*?)</\1>', row_html, re.IGNORECASE | re.DOTALL):
+                    for cell in _CELL_RE.finditer(row_html):
                         row.append(self._extract_cell_text(cell.group(2)))
 
                     if row:
                         # If no headers yet and first row has <th>, use as headers
-                        if not headers and '<th' in row_html.lower():
+                        if not headers and _TH_OPEN_RE.search(row_html):
                             headers = row
                         else:
                             rows.append(row)
@@ -1231,21 +1390,26 @@ class FilingParserV2:
         corrupting financial data (e.g., "100^(1)" is misleading when it
         should be "100" with a footnote reference).
         """
-        # Convert <br> to newlines
-        text = re.sub(r'<br\s*/?>', '\n', cell_html, flags=re.IGNORECASE)
-
-        # Handle superscripts - typically footnote references in SEC filings
-        # Strip them entirely to avoid corrupting data; footnotes are separate
-        text = re.sub(r'<sup[^>]*>.*?</sup>', '', text, flags=re.IGNORECASE | re.DOTALL)
-
-        # Handle subscripts - also typically formatting that can be stripped
-        text = re.sub(r'<sub[^>]*>.*?</sub>', '', text, flags=re.IGNORECASE | re.DOTALL)
-
-        # Strip remaining tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = cell_html
+        # Most cells are bare numbers or words; a single C-level scan for
+        # '<' rules out all of the tag passes below
+        if '<' in text:
+            # Convert <br> to newlines
+            text = _BR_RE.sub('\n', text)
+
+            # Handle superscripts - typically footnote references in SEC filings
+            # Strip them entirely to avoid corrupting data; footnotes are separate
+            text = _SUP_RE.sub('', text)
+
+            # Handle subscripts - also typically formatting that can be stripped
+            text = _SUB_RE.sub('', text)
+
+            # Strip remaining tags
+            text = _TAG_RE.sub('', text)
         # Normalize whitespace but preserve newlines
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r' *\n *', '\n', text)
+        text = _HSPACE_RUN_RE.sub(' ', text)
+        if '\n' in text:
+            text = _NEWLINE_PADDING_RE.sub('\n', text)
         return text.strip()
 
 
@@ -1253,27 +1417,60 @@ class FilingParserV2:
 # Output Writers
 # =============================================================================
 
-def write_display_artifacts(parsed: ParsedFiling, output_dir: Path) -> Dict[str, Path]:
-    """Write display artifacts for UI rendering."""
+def _write_utf8(path: Path, content: str) -> None:
+    """Write a string to path as UTF-8 with a single unbuffered write.
+
+    Skips the TextIOWrapper/BufferedWriter layers of open(), which add
+    nothing for one-shot writes of an already complete document.
+    """
+    data = content.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def write_display_artifacts(
+    parsed: ParsedFiling,
+    output_dir: Path,
+    sections_archive: bool = False,
+) -> Dict[str, Path]:
+    """Write display artifacts for UI rendering.
+
+    Args:
+        sections_archive: If True, store per-section HTML as entries of a
+            single uncompressed display/sections.zip instead of one file per
+            section. Saves an inode per section, but readers must support it.
+    """
     display_dir = output_dir / "display"
     display_dir.mkdir(parents=True, exist_ok=True)
-    sections_dir = display_dir / "sections"
-    sections_dir.mkdir(exist_ok=True)
 
     paths = {}
 
     # 1. Raw primary HTML (as-filed)
     raw_path = display_dir / "raw_primary.html"
-    with open(raw_path, 'w', encoding='utf-8') as f:
-        f.write(parsed.raw_html)
+    _write_utf8(raw_path, parsed.raw_html)
     paths["raw_html"] = raw_path
 
     # 2. Per-section HTML
-    for section in parsed.sections:
-        section_path = sections_dir / f"{section.id}.html"
-        with open(section_path, 'w', encoding='utf-8') as f:
-            f.write(section.html)
-        paths[f"section_{section.id}"] = section_path
+    if sections_archive:
+        # ZIP_STORED keeps entries randomly readable without decompression
+        archive_path = display_dir / "sections.zip"
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED) as zf:
+            for section in parsed.sections:
+                zf.writestr(f"{section.id}.html", section.html)
+        paths["sections_archive"] = archive_path
+    else:
+        sections_dir = display_dir / "sections"
+        sections_dir.mkdir(exist_ok=True)
+        for section in parsed.sections:
+            section_path = sections_dir / f"{section.id}.html"
+            _write_utf8(section_path, section.html)
+            paths[f"section_{section.id}"] = section_path
 
     # 3. Manifest
     manifest = {
@@ -1355,10 +1552,14 @@ def write_rag_artifacts(parsed: ParsedFiling, output_dir: Path) -> Dict[str, Pat
     return paths
 
 
-def write_all_artifacts(parsed: ParsedFiling, output_dir: Path) -> Dict[str, Path]:
+def write_all_artifacts(
+    parsed: ParsedFiling,
+    output_dir: Path,
+    sections_archive: bool = False,
+) -> Dict[str, Path]:
     """Write all artifacts (display + RAG)."""
     paths = {}
-    paths.update(write_display_artifacts(parsed, output_dir))
+    paths.update(write_display_artifacts(parsed, output_dir, sections_archive=sections_archive))
     paths.update(write_rag_artifacts(parsed, output_dir))
     return paths
 
@@ -1376,9 +1577,10 @@ def parse_filing(
     form_type: str,
     filed_at: str,
     report_period: Optional[str] = None,
+    text_extractor: str = "html.parser",
 ) -> ParsedFiling:
     """Convenience function to parse a filing."""
-    parser = FilingParserV2()
+    parser = FilingParserV2(text_extractor=text_extractor)
     return parser.parse(
         html_content=html_content,
         filing_id=filing_id,
@@ -15,11 +15,15 @@ Handles:
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -29,7 +33,7 @@ from models import Filing, FilingStatus
 from provider import SECProvider, SECFiling
 from state import StateStore
 from storage import FileStorage
-from parser import parse_filing, write_derivatives
+from parser import ParsedFiling, parse_filing, write_derivatives
 
 
 logger = logging.getLogger(__name__)
@@ -74,10 +78,12 @@ class PDFRenderer:
         method: str = "skip",  # "sec-api", "wkhtmltopdf", "skip"
         sec_api_key: Optional[str] = None,
         user_agent: str = "SECWatcher/1.0",
+        pool_size: int = 10,
     ):
         self.method = method
         self.sec_api_key = sec_api_key
         self.user_agent = user_agent
+        self.pool_size = pool_size
 
         if method == "sec-api" and not sec_api_key:
             raise ValueError("sec_api_key required for sec-api rendering")
@@ -89,7 +95,11 @@ class PDFRenderer:
         """Create session for sec-api.io requests."""
         session = requests.Session()
         retry = Retry(total=3, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         session.headers.update({
@@ -141,8 +151,35 @@ class PDFRenderer:
             logger.error(f"sec-api.io PDF render failed: {e}")
             return None
 
+    def render_to_file(self, filing_url: str) -> Optional[str]:
+        """
+        Render filing URL to a temporary PDF file (wkhtmltopdf only).
+
+        Lets large PDFs go to storage straight from disk instead of through
+        memory. The caller deletes the file.
+
+        Returns:
+            Path to the PDF, or None if rendering failed or the method does
+            not produce a file (use render())
+        """
+        if self.method != "wkhtmltopdf":
+            return None
+        return self._render_wkhtmltopdf_file(filing_url)
+
     def _render_wkhtmltopdf(self, filing_url: str) -> Optional[bytes]:
         """Render using local wkhtmltopdf."""
+        tmp_path = self._render_wkhtmltopdf_file(filing_url)
+        if tmp_path is None:
+            return None
+        try:
+            with open(tmp_path, "rb") as f:
+                return f.read()
+        finally:
+            os.unlink(tmp_path)
+
+    def _render_wkhtmltopdf_file(self, filing_url: str) -> Optional[str]:
+        """Run wkhtmltopdf into a temp file and return its path."""
+        tmp_path = None
         try:
             import subprocess
             import tempfile
@@ -162,17 +199,18 @@ class PDFRenderer:
             result = subprocess.run(cmd, capture_output=True, timeout=120)
             if result.returncode != 0:
                 logger.warning(f"wkhtmltopdf failed: {result.stderr.decode()}")
+                os.unlink(tmp_path)
                 return None
 
-            with open(tmp_path, "rb") as f:
-                return f.read()
+            return tmp_path
 
         except FileNotFoundError:
             logger.warning("wkhtmltopdf not installed")
-            return None
         except Exception as e:
             logger.error(f"wkhtmltopdf render failed: {e}")
-            return None
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return None
 
 
 class FilingProcessor:
@@ -199,7 +237,19 @@ class FilingProcessor:
         generate_derivatives: bool = True,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        parse_workers: Optional[int] = None,
+        state_batch_size: int = 25,
     ):
+        """
+        Initialize processor.
+
+        Args:
+            max_workers: Concurrent filing downloads
+            parse_workers: Processes used for parsing (default: CPU count,
+                0 parses inline on the download thread)
+            state_batch_size: Completed filings per state index commit
+                (0 commits once, after the whole download phase)
+        """
         self.state = state
         self.storage = storage
         self.provider = provider
@@ -209,6 +259,108 @@ class FilingProcessor:
         self.generate_derivatives = generate_derivatives
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.state_batch_size = state_batch_size
+        # Separate pool so a worker can overlap its JSON and HTML downloads
+        # without competing with process_discovered's per-filing workers
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sec-fetch"
+        )
+        # Raw artifacts are written here while the worker parses the HTML,
+        # so disk/upload time overlaps parse time instead of preceding it
+        self._write_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="storage-writer"
+        )
+        # Parsing is CPU-bound, so it runs in worker processes instead of
+        # contending for the GIL with download threads
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        self.parse_workers = parse_workers
+        self._parse_pool_lock = threading.Lock()
+        self._parse_pool = self._create_parse_pool() if parse_workers > 0 else None
+
+    def _create_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        Create the parse worker pool.
+
+        Workers come from a forkserver (spawn where unavailable) rather than
+        fork: forking copies the threads and locks of the download pools and
+        HTTP sessions in whatever state they are in.
+        """
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context(method),
+        )
+
+    def _parse(self, **kwargs: Any):
+        """Run parse_filing in the parse pool (or inline if disabled)."""
+        if self._parse_pool is None:
+            return parse_filing(**kwargs)
+
+        pool = self._parse_pool
+        try:
+            return pool.submit(parse_filing, **kwargs).result()
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault); every later submit to this
+            # pool would fail too, so replace it and retry this filing once
+            with self._parse_pool_lock:
+                if self._parse_pool is pool:
+                    logger.warning("Parse worker pool broke, restarting it")
+                    pool.shutdown(wait=False)
+                    self._parse_pool = self._create_parse_pool()
+                pool = self._parse_pool
+            return pool.submit(parse_filing, **kwargs).result()
+
+    def close(self) -> None:
+        """Shut down the fetch, write and parse worker pools."""
+        self._fetch_pool.shutdown(wait=True)
+        self._write_pool.shutdown(wait=True)
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+
+    def _fetch_documents(self, sec_filing: SECFiling) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Download JSON metadata and HTML content for a filing concurrently.
+
+        The JSON request runs on the fetch pool while the HTML (the larger
+        payload) is downloaded on the calling thread.
+
+        Returns:
+            Tuple of (json_data, html_content), either can be None
+        """
+        json_future = self._fetch_pool.submit(self.provider.download_filing_json, sec_filing)
+        html_content = self.provider.download_filing_html(sec_filing)
+        return json_future.result(), html_content
+
+    def _parse_html(self, filing: Filing, html_content: str) -> Optional[ParsedFiling]:
+        """
+        Parse filing HTML for derivatives.
+
+        Returns:
+            ParsedFiling, or None if parsing failed (logged; derivative
+            errors do not fail the filing)
+        """
+        try:
+            return self._parse(
+                html_content=html_content,
+                filing_id=filing.accession_number,
+                cik=filing.cik,
+                ticker=filing.ticker or "",
+                company_name=filing.company_name,
+                form_type=filing.form_type,
+                filed_at=filing.filed_at.strftime("%Y-%m-%d") if filing.filed_at else "",
+                report_period=filing.period_of_report,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+            )
+        except BrokenProcessPool as e:
+            logger.error(f"Parse worker pool broke twice on {filing.key}: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to generate derivatives for {filing.key}: {e}")
+            return None
 
     def process_filing(self, filing: Filing) -> ProcessingResult:
         """
@@ -223,63 +375,39 @@ class FilingProcessor:
         result = ProcessingResult(filing=filing, success=False)
 
         try:
-            # Download JSON metadata
-            json_data = self.provider.download_filing_json(
-                SECFiling(
-                    cik=filing.cik,
-                    accession_number=filing.accession_number,
-                    form_type=filing.form_type,
-                    filed_at=filing.filed_at,
-                    accepted_at=filing.accepted_at,
-                    company_name=filing.company_name,
-                    primary_document="",
-                    filing_url=filing.filing_url or "",
-                    index_url=filing.index_url or "",
-                )
-            )
+            # Download JSON metadata and HTML content
+            json_data, html_content = self._fetch_documents(SECFiling.from_filing(filing))
 
+            # Saved in one call so remote backends upload both concurrently,
+            # in the background while the HTML is parsed
+            artifacts = []
             if json_data:
-                filing.json_path = self.storage.save_json(filing, json_data)
+                artifacts.append((filing, "json", json_data))
+            if html_content:
+                artifacts.append((filing, "html", html_content))
+            save_future = self._write_pool.submit(self.storage.save_many, artifacts)
+
+            parsed = None
+            if html_content and self.generate_derivatives:
+                parsed = self._parse_html(filing, html_content)
+
+            # Waits for the writes; a failed save fails the filing as before
+            paths = save_future.result()
+            saved = {kind: path for (_, kind, _), path in zip(artifacts, paths)}
+
+            if "json" in saved:
+                filing.json_path = saved["json"]
                 result.json_downloaded = True
                 logger.debug(f"Downloaded JSON for {filing.key}")
 
-            # Download HTML content
-            html_content = self.provider.download_filing_html(
-                SECFiling(
-                    cik=filing.cik,
-                    accession_number=filing.accession_number,
-                    form_type=filing.form_type,
-                    filed_at=filing.filed_at,
-                    accepted_at=filing.accepted_at,
-                    company_name=filing.company_name,
-                    primary_document="",
-                    filing_url=filing.filing_url or "",
-                    index_url=filing.index_url or "",
-                )
-            )
-
-            if html_content:
-                filing.html_path = self.storage.save_html(filing, html_content)
+            if "html" in saved:
+                filing.html_path = saved["html"]
                 result.html_downloaded = True
                 logger.debug(f"Downloaded HTML for {filing.key}")
 
-                # Parse and generate AI/UI derivatives
-                if self.generate_derivatives:
+                # Write AI/UI derivatives
+                if parsed is not None:
                     try:
-                        parsed = parse_filing(
-                            html_content=html_content,
-                            filing_id=filing.accession_number,
-                            cik=filing.cik,
-                            ticker=filing.ticker or "",
-                            company_name=filing.company_name,
-                            form_type=filing.form_type,
-                            filed_at=filing.filed_at.strftime("%Y-%m-%d") if filing.filed_at else "",
-                            report_period=filing.period_of_report,
-                            chunk_size=self.chunk_size,
-                            chunk_overlap=self.chunk_overlap,
-                        )
-
-                        # Write derivative files
                         output_dir = self.storage.get_filing_dir(filing)
                         base_name = self.storage.get_filing_basename(filing)
                         derivative_paths = write_derivatives(parsed, output_dir, base_name)
@@ -301,7 +429,17 @@ class FilingProcessor:
                         # Don't fail the whole processing for derivative errors
 
             # Render PDF if enabled
-            if self.pdf_renderer.method != "skip" and filing.filing_url:
+            if self.pdf_renderer.method == "wkhtmltopdf" and filing.filing_url:
+                # Rendered to disk; storage streams it from there
+                pdf_file = self.pdf_renderer.render_to_file(filing.filing_url)
+                if pdf_file:
+                    try:
+                        filing.pdf_path = self.storage.save_pdf_from_path(filing, pdf_file)
+                    finally:
+                        os.unlink(pdf_file)
+                    result.pdf_downloaded = True
+                    logger.debug(f"Rendered PDF for {filing.key}")
+            elif self.pdf_renderer.method != "skip" and filing.filing_url:
                 pdf_content = self.pdf_renderer.render(filing.filing_url)
                 if pdf_content:
                     filing.pdf_path = self.storage.save_pdf(filing, pdf_content)
@@ -332,6 +470,18 @@ class FilingProcessor:
 
         return result
 
+    def _claim_and_process(self, filing: Filing) -> Optional[ProcessingResult]:
+        """Claim a filing and process it, or return None if already claimed."""
+        if hasattr(self.state, 'claim_filing'):
+            if not self.state.claim_filing(filing):
+                logger.debug(f"Filing {filing.key} already claimed")
+                return None
+        else:
+            filing.status = FilingStatus.DOWNLOADING
+            self.state.upsert_filing(filing)
+
+        return self.process_filing(filing)
+
     def process_discovered(
         self,
         limit: Optional[int] = None,
@@ -363,38 +513,42 @@ class FilingProcessor:
         results: List[ProcessingResult] = []
         completed = 0
 
-        # Process with thread pool
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Claim and submit filings
-            futures = {}
-            for filing in discovered:
-                # Try to claim the filing
-                if hasattr(self.state, 'claim_filing'):
-                    if not self.state.claim_filing(filing):
-                        logger.debug(f"Filing {filing.key} already claimed")
-                        continue
-                else:
-                    filing.status = FilingStatus.DOWNLOADING
-                    self.state.upsert_filing(filing)
-
-                future = executor.submit(self.process_filing, filing)
-                futures[future] = filing
-
-            # Process results as they complete
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    filing = futures[future]
-                    logger.error(f"Unexpected error processing {filing.key}: {e}")
-                    results.append(ProcessingResult(
-                        filing=filing, success=False, error=str(e)
-                    ))
-
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, len(discovered))
+        # Status upserts only touch the in-memory index until the batch is
+        # committed, so the index is written once per state_batch_size
+        # filings, not per filing; committing as the run goes bounds how much
+        # finished work a crash leaves unindexed
+        self.state.begin_batch()
+        try:
+            # Process with thread pool
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Claiming happens on the workers so the first downloads start
+                # without waiting for every claim round trip to finish
+                futures = {
+                    executor.submit(self._claim_and_process, filing): filing
+                    for filing in discovered
+                }
+
+                # Process results as they complete
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                        if result is not None:
+                            results.append(result)
+                    except Exception as e:
+                        filing = futures[future]
+                        logger.error(f"Unexpected error processing {filing.key}: {e}")
+                        results.append(ProcessingResult(
+                            filing=filing, success=False, error=str(e)
+                        ))
+
+                    completed += 1
+                    if self.state_batch_size and completed % self.state_batch_size == 0:
+                        self.state.commit_batch()
+                        self.state.begin_batch()
+                    if progress_callback:
+                        progress_callback(completed, len(discovered))
+        finally:
+            self.state.commit_batch()
 
         # Build summary
         succeeded = sum(1 for r in results if r.success)
@@ -436,6 +590,8 @@ def create_processor(
         method=pdf_method,
         sec_api_key=sec_api_key,
         user_agent=config.get("user_agent", "SECWatcher/1.0"),
+        # Every download worker may render at the same time
+        pool_size=max(10, int(config.get("concurrency", 4))),
     )
 
     return FilingProcessor(
@@ -448,4 +604,6 @@ def create_processor(
         generate_derivatives=config.get("generate_derivatives", True),
         chunk_size=config.get("chunk_size", 1000),
         chunk_overlap=config.get("chunk_overlap", 200),
+        parse_workers=config.get("parse_workers"),
+        state_batch_size=config.get("state_batch_size", 25),
     )
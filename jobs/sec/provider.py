@@ -16,12 +16,21 @@ Endpoints used:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
 import logging
+import os
+import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timedelta, time as dt_time
+from itertools import islice, zip_longest
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from urllib.parse import urljoin
 
 import requests
@@ -30,6 +39,24 @@ from urllib3.util.retry import Retry
 
 from models import Filing, FormType, FilingStatus
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp such as 2024-01-15T16:05:31.000Z."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +65,47 @@ logger = logging.getLogger(__name__)
 SEC_BASE_URL = "https://www.sec.gov"
 SEC_DATA_URL = "https://data.sec.gov"
 SEC_ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+# company_tickers.json (~1MB) changes at most daily
+DEFAULT_TICKER_MAP_TTL = 86400
+
+# Upper bound on a single retry backoff, in seconds
+RETRY_BACKOFF_MAX = 60
+
+# Minimum connections kept alive per host by the shared session
+HTTP_POOL_SIZE = 50
+
+# In-memory get_company_filings results (same CIK asked twice in one run)
+DEFAULT_FILINGS_CACHE_SIZE = 128
+DEFAULT_FILINGS_CACHE_TTL = 300
+
+# Disk-cached submissions JSON is reused for this long (when cache_dir is set)
+DEFAULT_SUBMISSIONS_TTL = 21600
+
+# Rate limiting - SEC allows max 10 req/sec; a token bucket lets short
+# bursts through immediately and only throttles sustained load
+DEFAULT_BURST_CAPACITY = 10
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+# Circuit breaker: after this many consecutive throttled requests (429/5xx
+# that survived all retries), fail fast for the cooldown instead of
+# spending a full retry cycle on every remaining company
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN = 300
+# ...and after this many throttled requests in total, stay open for the rest
+# of the provider's life (0 disables)
+DEFAULT_CIRCUIT_BREAKER_MAX_FAILURES = 50
+
+# Statuses treated as SEC throttling / outage rather than a per-URL problem
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
-# Rate limiting - SEC recommends max 10 req/sec, but be conservative
-DEFAULT_REQUEST_INTERVAL = 0.5  # 500ms between requests (2 req/sec) - safer
 
+class RateLimitError(requests.RequestException):
+    """SEC is throttling or failing requests, or the circuit breaker is open."""
 
-@dataclass
+
+@dataclass(slots=True)
 class SECFiling:
     """Raw filing data from SEC."""
     cik: str
@@ -57,6 +119,252 @@ class SECFiling:
     index_url: str
     period_of_report: Optional[str] = None
 
+    @classmethod
+    def from_filing(cls, filing: Filing) -> "SECFiling":
+        """Create SECFiling from a stored Filing (for re-downloading artifacts)."""
+        return cls(
+            cik=filing.cik,
+            accession_number=filing.accession_number,
+            form_type=filing.form_type,
+            filed_at=filing.filed_at,
+            accepted_at=filing.accepted_at,
+            company_name=filing.company_name,
+            primary_document="",
+            filing_url=filing.filing_url or "",
+            index_url=filing.index_url or "",
+            period_of_report=filing.period_of_report,
+        )
+
+
+class JitteredRetry(Retry):
+    """
+    Retry with randomized exponential backoff.
+
+    Each wait is backoff_factor * 2^(n-1) scaled by a random factor in
+    [0.5, 1.5], so parallel workers that hit a 429 together don't retry in
+    lockstep. A Retry-After header still takes precedence (urllib3 honours
+    it before consulting the backoff).
+    """
+
+    def get_backoff_time(self) -> float:
+        retries = len(self.history)
+        if retries == 0:
+            return 0
+        backoff = self.backoff_factor * (2 ** (retries - 1))
+        return min(self.backoff_max, backoff * random.uniform(0.5, 1.5))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Holds up to `capacity` tokens, refilled at `refill_rate` tokens per
+    second. Each request consumes one token.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill_timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill_timestamp
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill_timestamp = now
+
+    def consume(self, tokens: float = 1) -> bool:
+        """
+        Take tokens if available.
+
+        Returns:
+            True if the tokens were taken, False if the bucket is short
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block until tokens are available, then take them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    Opens after `threshold` consecutive failures and stays open for
+    `cooldown` seconds. After the cooldown one request is let through;
+    a success closes the circuit, a failure re-opens it. Once
+    `max_failures` failures have accumulated (successes in between do not
+    reset them) the circuit stays open for good.
+    """
+
+    def __init__(self, threshold: int, cooldown: float, max_failures: int = 0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_failures = max_failures
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True if the circuit has tripped (including during a trial request)."""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Return True if a request may be attempted now."""
+        with self._lock:
+            if self._exhausted():
+                return False
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                # Half-open: restart the cooldown so only one trial goes out
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def _exhausted(self) -> bool:
+        """True once the total failure cap is reached (caller holds the lock)."""
+        return self.max_failures > 0 and self.total_failures >= self.max_failures
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            # Requests already in flight may succeed after the cap was hit
+            if not self._exhausted():
+                self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            if self._exhausted():
+                if self.total_failures == self.max_failures:
+                    logger.error(
+                        f"SEC circuit breaker open after {self.total_failures} throttled "
+                        f"requests in total; failing fast for the rest of the run"
+                    )
+                self._opened_at = time.monotonic()
+            elif self.threshold > 0 and self.consecutive_failures >= self.threshold:
+                if self._opened_at is None:
+                    logger.error(
+                        f"SEC circuit breaker open after {self.consecutive_failures} "
+                        f"consecutive throttled requests; pausing for {self.cooldown}s"
+                    )
+                self._opened_at = time.monotonic()
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after `ttl` seconds.
+
+    Holds at most `maxsize` entries, evicting the oldest insert first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value for `ttl` seconds."""
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class FileCache:
+    """
+    JSON file cache with a fixed TTL.
+
+    Each entry is stored as {"ts": <epoch seconds>, "data": <value>,
+    "validators": {...}} in {cache_dir}/{md5(key)}.json. Validators are
+    the HTTP ETag/Last-Modified headers, kept so an expired entry can be
+    revalidated with a conditional GET.
+    """
+
+    def __init__(self, cache_dir: str | Path, ttl: float):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the raw cache entry regardless of age, or None if missing."""
+        try:
+            with open(self._path(key), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within the TTL."""
+        return time.time() - entry.get("ts", 0) <= self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self.get_entry(key)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry.get("data")
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Store a value, replacing the file atomically."""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".tmp.{os.getpid()}.{threading.get_ident()}")
+        entry = {"ts": time.time(), "data": value, "validators": validators or {}}
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
 
 class SECProvider:
     """
@@ -65,12 +373,35 @@ class SECProvider:
     Uses the free SEC EDGAR APIs - no API key required.
     """
 
+    # Sessions shared by all providers in the process, keyed by
+    # (user_agent, retries, pool_size), so keep-alive connections survive
+    # across providers
+    _shared_sessions: Dict[Tuple[str, int, int], requests.Session] = {}
+    _shared_sessions_lock = threading.Lock()
+
+    # company_tickers.json is the same for every provider, so the parsed
+    # mapping is shared process-wide (see _get_ticker_map)
+    _ticker_map: Optional[Dict[str, str]] = None
+    _ticker_map_fetched_at = 0.0
+    _ticker_map_lock = threading.Lock()
+
     def __init__(
         self,
         user_agent: str = "SECWatcher/1.0 (research@example.com)",
         timeout: int = 30,
         retries: int = 3,
-        request_interval: float = DEFAULT_REQUEST_INTERVAL,
+        burst_capacity: int = DEFAULT_BURST_CAPACITY,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        ticker_map_ttl: float = DEFAULT_TICKER_MAP_TTL,
+        cache_dir: Optional[str] = None,
+        submissions_ttl: float = DEFAULT_SUBMISSIONS_TTL,
+        cache_maxsize: int = DEFAULT_FILINGS_CACHE_SIZE,
+        cache_ttl_sec: float = DEFAULT_FILINGS_CACHE_TTL,
+        cik_cache_path: Optional[str] = None,
+        pool_size: int = HTTP_POOL_SIZE,
+        circuit_breaker_threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+        circuit_breaker_cooldown: float = DEFAULT_CIRCUIT_BREAKER_COOLDOWN,
+        circuit_breaker_max_failures: int = DEFAULT_CIRCUIT_BREAKER_MAX_FAILURES,
     ):
         """
         Initialize SEC Provider.
@@ -79,54 +410,264 @@ class SECProvider:
             user_agent: Required User-Agent header (SEC requires valid contact info)
             timeout: Request timeout in seconds
             retries: Number of retry attempts
-            request_interval: Seconds between API requests (default: 0.5s)
+            burst_capacity: Requests allowed back-to-back before throttling
+            requests_per_second: Sustained request rate (SEC max: 10/sec)
+            ticker_map_ttl: Seconds before company_tickers.json is re-downloaded
+            cache_dir: Directory for on-disk response caching (disabled if None)
+            submissions_ttl: Seconds a cached submissions JSON stays fresh
+            cache_maxsize: Max get_company_filings results kept in memory
+            cache_ttl_sec: Seconds a get_company_filings result is reused (0 disables)
+            cik_cache_path: JSON file persisting ticker -> CIK lookups across runs
+            pool_size: Keep-alive connections per host (size to peak concurrent requests)
+            circuit_breaker_threshold: Consecutive throttled requests before failing
+                fast (0 disables)
+            circuit_breaker_cooldown: Seconds to fail fast once the breaker opens
+            circuit_breaker_max_failures: Throttled requests in total after which
+                the breaker stays open (0 disables)
         """
+        # The token bucket would divide by zero (rate 0), sleep a negative
+        # time (rate < 0) or never fill to one token (burst < 1) mid-run
+        if not requests_per_second > 0:
+            raise ValueError(f"requests_per_second must be positive, got {requests_per_second}")
+        if not burst_capacity >= 1:
+            raise ValueError(f"rate_limit_burst must be at least 1, got {burst_capacity}")
         self.user_agent = user_agent
         self.timeout = timeout
         self.retries = retries
-        self.request_interval = request_interval
-        self.session = self._create_session()
-        self._last_request_time = 0.0
+        self.session = self._get_shared_session(user_agent, retries, pool_size)
+        self._bucket = TokenBucket(burst_capacity, requests_per_second)
+        self._breaker = CircuitBreaker(
+            circuit_breaker_threshold, circuit_breaker_cooldown, circuit_breaker_max_failures
+        )
         self._cik_cache: Dict[str, str] = {}
-
-    def _create_session(self) -> requests.Session:
+        self._cik_fetched_at: Dict[str, float] = {}
+        self._cik_cache_lock = threading.Lock()
+        self._cik_cache_dirty = False
+        self.ticker_map_ttl = ticker_map_ttl
+        self.cik_cache_path = Path(cik_cache_path) if cik_cache_path else None
+        if self.cik_cache_path:
+            self._load_cik_cache()
+            atexit.register(self.flush_cik_cache)
+        self._submissions_cache: Optional[FileCache] = None
+        if cache_dir:
+            self._submissions_cache = FileCache(
+                Path(cache_dir) / "submissions", submissions_ttl
+            )
+        self._filings_cache: Optional[TTLCache] = None
+        if cache_ttl_sec > 0:
+            self._filings_cache = TTLCache(cache_maxsize, cache_ttl_sec)
+
+    @classmethod
+    def _get_shared_session(
+        cls, user_agent: str, retries: int, pool_size: int = HTTP_POOL_SIZE
+    ) -> requests.Session:
+        """Get the process-wide session for this configuration, creating it once."""
+        key = (user_agent, retries, pool_size)
+        with cls._shared_sessions_lock:
+            session = cls._shared_sessions.get(key)
+            if session is None:
+                session = cls._create_session(user_agent, retries, pool_size)
+                cls._shared_sessions[key] = session
+            return session
+
+    @staticmethod
+    def _create_session(
+        user_agent: str, retries: int, pool_size: int = HTTP_POOL_SIZE
+    ) -> requests.Session:
         """Create session with retry configuration."""
         session = requests.Session()
 
-        retry_strategy = Retry(
-            total=self.retries,
+        retry_strategy = JitteredRetry(
+            total=retries,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_max=RETRY_BACKOFF_MAX,
+            status_forcelist=sorted(THROTTLE_STATUS_CODES),
             allowed_methods=["GET", "HEAD"],
+            respect_retry_after_header=True,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         session.headers.update({
-            "User-Agent": self.user_agent,
+            "User-Agent": user_agent,
             "Accept": "application/json, application/xml, text/html",
             "Accept-Encoding": "gzip, deflate",
         })
 
         return session
 
+    def clear_cache(self) -> None:
+        """Forget cached get_company_filings results."""
+        if self._filings_cache:
+            self._filings_cache.clear()
+
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between SEC API requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.request_interval:
-            time.sleep(self.request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for a rate-limit token before an SEC API request."""
+        self._bucket.acquire()
+
+    @property
+    def circuit_open(self) -> bool:
+        """True if SEC throttling has tripped the circuit breaker."""
+        return self._breaker.is_open
 
     def _get(self, url: str, **kwargs) -> requests.Response:
-        """Make rate-limited GET request."""
+        """
+        Make rate-limited GET request.
+
+        Raises:
+            RateLimitError: SEC kept throttling/failing after retries, or the
+                circuit breaker is open
+        """
+        if not self._breaker.allow():
+            raise RateLimitError(f"SEC circuit breaker open, skipping {url}")
+
         self._rate_limit()
         kwargs.setdefault("timeout", self.timeout)
-        response = self.session.get(url, **kwargs)
-        response.raise_for_status()
+        try:
+            response = self.session.get(url, **kwargs)
+            response.raise_for_status()
+        except requests.exceptions.RetryError as e:
+            # Retries on THROTTLE_STATUS_CODES were exhausted
+            self._breaker.record_failure()
+            raise RateLimitError(f"SEC request throttled: {url}") from e
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in THROTTLE_STATUS_CODES:
+                self._breaker.record_failure()
+                raise RateLimitError(f"SEC request throttled: {url}") from e
+            raise
+
+        self._breaker.record_success()
         return response
 
+    def _get_json_cached(self, url: str, cache: Optional[FileCache]) -> Any:
+        """
+        GET a JSON document through an optional file cache.
+
+        A fresh cache entry is returned without a request. An expired entry
+        is revalidated with If-None-Match/If-Modified-Since; on 304 Not
+        Modified the cached body is reused and its TTL restarted.
+
+        Args:
+            url: URL to fetch
+            cache: File cache for the response (None to always fetch)
+
+        Returns:
+            Decoded JSON
+        """
+        entry = cache.get_entry(url) if cache else None
+        if entry is not None and cache.is_fresh(entry):
+            logger.debug(f"Using cached response for {url}")
+            return entry.get("data")
+
+        headers = {}
+        validators = entry.get("validators", {}) if entry else {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        logger.debug(f"Fetching {url}")
+        response = self._get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Not modified: {url}")
+            data = entry.get("data")
+        else:
+            data = _json_loads(response.content)
+            validators = {}
+            if response.headers.get("ETag"):
+                validators["etag"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                validators["last_modified"] = response.headers["Last-Modified"]
+
+        if cache:
+            cache.set(url, data, validators=validators)
+        return data
+
+    def _get_ticker_map(self) -> Dict[str, str]:
+        """
+        Get the ticker -> CIK mapping from SEC's company_tickers.json.
+
+        Downloaded once per process and shared by all providers until
+        ticker_map_ttl expires.
+
+        Returns:
+            Dict of uppercase ticker -> zero-padded CIK
+        """
+        cls = type(self)
+        with cls._ticker_map_lock:
+            age = time.monotonic() - cls._ticker_map_fetched_at
+            if cls._ticker_map is None or age > self.ticker_map_ttl:
+                response = self._get(SEC_COMPANY_TICKERS_URL)
+                data = _json_loads(response.content)
+                cls._ticker_map = {
+                    entry["ticker"].upper(): str(entry["cik_str"]).zfill(10)
+                    for entry in data.values()
+                    if entry.get("ticker")
+                }
+                cls._ticker_map_fetched_at = time.monotonic()
+                logger.debug(f"Loaded {len(cls._ticker_map)} tickers from SEC")
+            return cls._ticker_map
+
+    @classmethod
+    def refresh_ticker_map(cls) -> None:
+        """Force the next CIK lookup to re-download company_tickers.json."""
+        with cls._ticker_map_lock:
+            cls._ticker_map = None
+            cls._ticker_map_fetched_at = 0.0
+
+    def _load_cik_cache(self) -> None:
+        """Load persisted CIK lookups, dropping entries older than the ticker map TTL."""
+        try:
+            with open(self.cik_cache_path, "rb") as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable CIK cache {self.cik_cache_path}: {e}")
+            return
+
+        now = time.time()
+        for ticker, entry in data.items():
+            try:
+                cik = entry["cik"]
+                fetched_at = float(entry["fetched_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if now - fetched_at < self.ticker_map_ttl:
+                self._cik_cache[ticker] = cik
+                self._cik_fetched_at[ticker] = fetched_at
+
+        logger.debug(f"Loaded {len(self._cik_cache)} cached CIKs from {self.cik_cache_path}")
+
+    def flush_cik_cache(self) -> None:
+        """Write new CIK lookups to the on-disk cache (no-op if nothing changed)."""
+        if not self.cik_cache_path or not self._cik_cache_dirty:
+            return
+
+        with self._cik_cache_lock:
+            data = {
+                ticker: {"cik": cik, "fetched_at": self._cik_fetched_at.get(ticker, 0.0)}
+                for ticker, cik in self._cik_cache.items()
+            }
+            self._cik_cache_dirty = False
+
+        try:
+            self.cik_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cik_cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cik_cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write CIK cache {self.cik_cache_path}: {e}")
+
     def lookup_cik(self, ticker: str) -> Optional[str]:
         """
         Look up CIK for a ticker symbol.
@@ -143,21 +684,16 @@ class SECProvider:
         if ticker in self._cik_cache:
             return self._cik_cache[ticker]
 
-        # Use SEC's company tickers JSON
+        # Use SEC's company tickers mapping
         try:
-            url = f"{SEC_DATA_URL}/submissions/CIK0000000000.json"
-            # Actually, let's use the company tickers mapping
-            url = "https://www.sec.gov/files/company_tickers.json"
-            response = self._get(url)
-            data = response.json()
-
-            # Search for ticker in the mapping
-            for entry in data.values():
-                if entry.get("ticker", "").upper() == ticker:
-                    cik = str(entry["cik_str"]).zfill(10)
+            cik = self._get_ticker_map().get(ticker)
+            if cik:
+                with self._cik_cache_lock:
                     self._cik_cache[ticker] = cik
-                    logger.debug(f"Resolved {ticker} -> CIK {cik}")
-                    return cik
+                    self._cik_fetched_at[ticker] = time.time()
+                    self._cik_cache_dirty = True
+                logger.debug(f"Resolved {ticker} -> CIK {cik}")
+                return cik
 
             logger.warning(f"CIK not found for ticker {ticker}")
             return None
@@ -166,6 +702,115 @@ class SECProvider:
             logger.error(f"Error looking up CIK for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def _start_date_cutoff(start_date: Optional[datetime]) -> Optional[str]:
+        """
+        Convert start_date to a YYYY-MM-DD cutoff for string comparison.
+
+        ISO dates sort lexicographically, so the cutoff is a plain string
+        compare. A filing dated D is older than start_date exactly when
+        D < start_date rounded up to a whole day.
+        """
+        if not start_date:
+            return None
+        cutoff_day = start_date.date()
+        if start_date.time() != dt_time.min:
+            cutoff_day += timedelta(days=1)
+        return cutoff_day.isoformat()
+
+    def _iter_filings(
+        self,
+        cik: str,
+        form_types: List[str],
+        start_date: Optional[datetime] = None,
+    ) -> Iterator[SECFiling]:
+        """
+        Yield a company's filings lazily, newest first (SEC order).
+
+        Rows are only parsed as they are consumed, so callers that stop
+        early skip the rest of the submissions arrays. Fetch errors
+        propagate to the caller.
+
+        Args:
+            cik: Zero-padded company CIK
+            form_types: Form types to include
+            start_date: Stop at the first filing before this date
+        """
+        wanted_forms = frozenset(form_types)
+        cutoff = self._start_date_cutoff(start_date)
+
+        # Fetch company submissions
+        url = f"{SEC_DATA_URL}/submissions/CIK{cik}.json"
+        data = self._get_json_cached(url, self._submissions_cache)
+
+        company_name = data.get("name", "Unknown")
+        recent = data.get("filings", {}).get("recent", {})
+
+        if not recent:
+            logger.warning(f"No recent filings for CIK {cik}")
+            return
+
+        accession_numbers = recent.get("accessionNumber", [])
+        forms = recent.get("form", [])
+        filing_dates = recent.get("filingDate", [])
+        primary_docs = recent.get("primaryDocument", [])
+        report_dates = recent.get("reportDate", [])
+        accepted_dates = recent.get("acceptanceDateTime", [])
+
+        # Archive URLs share this prefix for every filing of the company
+        archive_prefix = f"{SEC_ARCHIVES_URL}/{cik.lstrip('0')}"
+
+        # One row per accession number; shorter columns are padded with None
+        rows = islice(
+            zip_longest(
+                accession_numbers, forms, filing_dates,
+                primary_docs, report_dates, accepted_dates,
+            ),
+            len(accession_numbers),
+        )
+
+        # Iterate through ALL entries - companies file many form types (8-K, 4, etc.)
+        # so 10-K/10-Q might be spread across hundreds of entries
+        for accession, form, filed_at_str, primary_doc, report_date, accepted_str in rows:
+            # Stop if we've gone past the start date (filings are in reverse chronological order)
+            if cutoff and filed_at_str and filed_at_str < cutoff:
+                return
+
+            # Filter by form type before parsing - most rows are other forms
+            if form not in wanted_forms:
+                continue
+
+            try:
+                filed_at = datetime.fromisoformat(filed_at_str)
+            except (TypeError, ValueError):
+                continue
+
+            # Parse accepted datetime (format: 2024-01-15T16:05:31.000Z)
+            accepted_at = None
+            if accepted_str:
+                try:
+                    accepted_at = _parse_timestamp(accepted_str)
+                except ValueError:
+                    pass
+
+            # Build URLs
+            filing_dir = f"{archive_prefix}/{accession.replace('-', '')}"
+            filing_url = f"{filing_dir}/{primary_doc or ''}"
+            index_url = f"{filing_dir}/{accession}-index.html"
+
+            yield SECFiling(
+                cik=cik,
+                accession_number=accession,
+                form_type=form,
+                filed_at=filed_at,
+                accepted_at=accepted_at,
+                company_name=company_name,
+                primary_document=primary_doc or "",
+                filing_url=filing_url,
+                index_url=index_url,
+                period_of_report=report_date,
+            )
+
     def get_company_filings(
         self,
         cik: str,
@@ -183,7 +828,7 @@ class SECProvider:
             limit: Maximum number of filings to return
 
         Returns:
-            List of SECFiling objects, ordered by filed_at descending
+            List of SECFiling objects, newest first (SEC order)
         """
         if form_types is None:
             form_types = ["10-K", "10-Q"]
@@ -191,98 +836,52 @@ class SECProvider:
         # Normalize CIK
         cik = cik.lstrip("0").zfill(10)
 
+        cache_key = (
+            cik, tuple(sorted(set(form_types))), self._start_date_cutoff(start_date), limit,
+        )
+        if self._filings_cache:
+            cached = self._filings_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
         try:
-            # Fetch company submissions
-            url = f"{SEC_DATA_URL}/submissions/CIK{cik}.json"
-            logger.debug(f"Fetching filings from {url}")
-            response = self._get(url)
-            data = response.json()
-
-            company_name = data.get("name", "Unknown")
-            recent = data.get("filings", {}).get("recent", {})
-
-            if not recent:
-                logger.warning(f"No recent filings for CIK {cik}")
-                return []
-
-            # Parse filings
-            filings = []
-            accession_numbers = recent.get("accessionNumber", [])
-            forms = recent.get("form", [])
-            filing_dates = recent.get("filingDate", [])
-            primary_docs = recent.get("primaryDocument", [])
-            report_dates = recent.get("reportDate", [])
-            accepted_dates = recent.get("acceptanceDateTime", [])
-
-            # Iterate through ALL entries - companies file many form types (8-K, 4, etc.)
-            # so 10-K/10-Q might be spread across hundreds of entries
-            for i in range(len(accession_numbers)):
-                form = forms[i] if i < len(forms) else ""
-                accession = accession_numbers[i] if i < len(accession_numbers) else ""
-                filed_at_str = filing_dates[i] if i < len(filing_dates) else ""
-                primary_doc = primary_docs[i] if i < len(primary_docs) else ""
-                report_date = report_dates[i] if i < len(report_dates) else None
-                accepted_str = accepted_dates[i] if i < len(accepted_dates) else None
-
-                # Parse dates first to check if we've gone past start_date
-                try:
-                    filed_at = datetime.strptime(filed_at_str, "%Y-%m-%d")
-                except ValueError:
-                    continue
+            filings = list(islice(self._iter_filings(cik, form_types, start_date), limit))
+        except Exception as e:
+            logger.error(f"Error fetching filings for CIK {cik}: {e}")
+            return []
 
-                # Stop if we've gone past the start date (filings are in reverse chronological order)
-                if start_date and filed_at < start_date:
-                    break
+        if self._filings_cache:
+            self._filings_cache.set(cache_key, list(filings))
 
-                # Filter by form type
-                if form not in form_types:
-                    continue
-
-                # Parse accepted datetime
-                accepted_at = None
-                if accepted_str:
-                    try:
-                        # Format: 2024-01-15T16:05:31.000Z
-                        accepted_at = datetime.fromisoformat(
-                            accepted_str.replace("Z", "+00:00").replace(".000", "")
-                        )
-                    except ValueError:
-                        pass
-
-                # Build URLs
-                accession_nodash = accession.replace("-", "")
-                filing_url = f"{SEC_ARCHIVES_URL}/{cik.lstrip('0')}/{accession_nodash}/{primary_doc}"
-                index_url = f"{SEC_ARCHIVES_URL}/{cik.lstrip('0')}/{accession_nodash}/{accession}-index.html"
-
-                filing = SECFiling(
-                    cik=cik,
-                    accession_number=accession,
-                    form_type=form,
-                    filed_at=filed_at,
-                    accepted_at=accepted_at,
-                    company_name=company_name,
-                    primary_document=primary_doc,
-                    filing_url=filing_url,
-                    index_url=index_url,
-                    period_of_report=report_date,
-                )
-                filings.append(filing)
-
-                if len(filings) >= limit:
-                    break
+        logger.info(f"Found {len(filings)} filings for CIK {cik}")
+        return filings
 
-            # Sort by filed_at descending, then by accession number
-            filings.sort(
-                key=lambda f: (f.accepted_at or f.filed_at, f.accession_number),
-                reverse=True,
-            )
+    def get_company_filings_many(
+        self,
+        ciks: List[str],
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Dict[str, List[SECFiling]]:
+        """
+        Get filings for many companies concurrently.
 
-            logger.info(f"Found {len(filings)} filings for CIK {cik}")
-            return filings[:limit]
+        Requests overlap on a thread pool so network latency is not paid
+        serially; the shared token bucket still caps the overall rate.
 
-        except Exception as e:
-            logger.error(f"Error fetching filings for CIK {cik}: {e}")
-            return []
+        Args:
+            ciks: Company CIKs
+            max_workers: Concurrent requests (default: rate-limit burst capacity)
+            **kwargs: Passed through to get_company_filings
+
+        Returns:
+            Dict of CIK -> filings, in the order given
+        """
+        if not ciks:
+            return {}
+        workers = max_workers or int(self._bucket.capacity)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-provider") as executor:
+            results = executor.map(lambda cik: self.get_company_filings(cik, **kwargs), ciks)
+            return dict(zip(ciks, results))
 
     def get_latest_filings(
         self,
@@ -292,6 +891,9 @@ class SECProvider:
         """
         Get the latest 10-K and 10-Q for a company.
 
+        Scans the 20 most recent 10-K/10-Q filings lazily and stops as soon
+        as one of each is found.
+
         Args:
             cik: Company CIK
             company_name: Optional company name for logging
@@ -299,19 +901,32 @@ class SECProvider:
         Returns:
             Tuple of (latest_10k, latest_10q), either can be None
         """
-        filings = self.get_company_filings(cik, form_types=["10-K", "10-Q"], limit=20)
+        cik = cik.lstrip("0").zfill(10)
+
+        cache_key = ("latest", cik)
+        if self._filings_cache:
+            cached = self._filings_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         latest_10k = None
         latest_10q = None
 
-        for filing in filings:
-            if filing.form_type == "10-K" and latest_10k is None:
-                latest_10k = filing
-            elif filing.form_type == "10-Q" and latest_10q is None:
-                latest_10q = filing
+        try:
+            for filing in islice(self._iter_filings(cik, ["10-K", "10-Q"]), 20):
+                if filing.form_type == "10-K" and latest_10k is None:
+                    latest_10k = filing
+                elif filing.form_type == "10-Q" and latest_10q is None:
+                    latest_10q = filing
+
+                if latest_10k and latest_10q:
+                    break
+        except Exception as e:
+            logger.error(f"Error fetching filings for CIK {cik}: {e}")
+            return None, None
 
-            if latest_10k and latest_10q:
-                break
+        if self._filings_cache:
+            self._filings_cache.set(cache_key, (latest_10k, latest_10q))
 
         name = company_name or cik
         if latest_10k:
@@ -321,6 +936,29 @@ class SECProvider:
 
         return latest_10k, latest_10q
 
+    def get_latest_filings_many(
+        self,
+        ciks: List[str],
+        workers: int = 8,
+    ) -> Dict[str, Tuple[Optional[SECFiling], Optional[SECFiling]]]:
+        """
+        Get the latest 10-K and 10-Q for many companies concurrently.
+
+        The token bucket is shared and locked, so parallel workers stay
+        within the SEC rate limit.
+
+        Args:
+            ciks: Company CIKs
+            workers: Concurrent requests
+
+        Returns:
+            Dict of CIK -> (latest_10k, latest_10q), in the order given
+        """
+        if not ciks:
+            return {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-provider") as executor:
+            return dict(zip(ciks, executor.map(self.get_latest_filings, ciks)))
+
     def get_filings_since(
         self,
         cik: str,
@@ -370,6 +1008,34 @@ class SECProvider:
             limit=years * 6,  # ~6 filings per year (1x10K + 4x10Q + buffer)
         )
 
+    def get_backfill_filings_many(
+        self,
+        ciks: List[str],
+        years: int,
+        form_types: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, List[SECFiling]]:
+        """
+        Get backfill filings for many companies concurrently.
+
+        Args:
+            ciks: Company CIKs
+            years: Number of years to go back
+            form_types: Filter by form types
+            max_workers: Concurrent requests (default: rate-limit burst capacity)
+
+        Returns:
+            Dict of CIK -> filings within the time window, in the order given
+        """
+        if not ciks:
+            return {}
+        workers = max_workers or int(self._bucket.capacity)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-provider") as executor:
+            results = executor.map(
+                lambda cik: self.get_backfill_filings(cik, years, form_types), ciks
+            )
+            return dict(zip(ciks, results))
+
     def download_filing_html(self, filing: SECFiling) -> Optional[str]:
         """
         Download the primary filing document as HTML.
@@ -387,6 +1053,31 @@ class SECProvider:
             logger.error(f"Error downloading {filing.filing_url}: {e}")
             return None
 
+    def download_filings_html_many(
+        self,
+        filings: List[SECFiling],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Download primary documents for many filings concurrently.
+
+        Downloads overlap on a thread pool; the shared token bucket still
+        caps the overall request rate.
+
+        Args:
+            filings: Filings to download
+            max_workers: Concurrent downloads (default: rate-limit burst capacity)
+
+        Returns:
+            Dict of accession number -> HTML content (None on error)
+        """
+        if not filings:
+            return {}
+        workers = max_workers or int(self._bucket.capacity)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-provider") as executor:
+            results = executor.map(self.download_filing_html, filings)
+            return {f.accession_number: html for f, html in zip(filings, results)}
+
     def download_filing_json(self, filing: SECFiling) -> Optional[Dict]:
         """
         Download filing metadata as JSON.
@@ -404,7 +1095,7 @@ class SECProvider:
             url = f"{SEC_ARCHIVES_URL}/{cik}/{accession}/index.json"
 
             response = self._get(url)
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Error downloading JSON for {filing.accession_number}: {e}")
             return None
@@ -439,11 +1130,66 @@ class SECProvider:
         )
 
 
+def _rate_limit_settings(config: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    Read (burst_capacity, requests_per_second) from config.
+
+    The deprecated request_interval (fixed seconds between requests) maps to
+    requests_per_second = 1 / interval with a burst of 1, which keeps the old
+    spacing, unless the token bucket keys are set explicitly.
+    """
+    burst = config.get("rate_limit_burst")
+    rate = config.get("requests_per_second")
+    interval = config.get("request_interval")
+
+    if interval is not None:
+        if rate is not None:
+            logger.warning("request_interval is deprecated and ignored because requests_per_second is set")
+        elif float(interval) > 0:
+            rate = 1.0 / float(interval)
+            if burst is None:
+                burst = 1
+            logger.warning(
+                f"request_interval is deprecated; use requests_per_second: {rate:g} "
+                f"(and rate_limit_burst) instead"
+            )
+        else:
+            logger.warning("request_interval is deprecated; use requests_per_second instead")
+
+    return (
+        burst if burst is not None else DEFAULT_BURST_CAPACITY,
+        rate if rate is not None else DEFAULT_REQUESTS_PER_SECOND,
+    )
+
+
 def create_provider(config: Dict[str, Any]) -> SECProvider:
     """Create SEC provider from config."""
+    burst_capacity, requests_per_second = _rate_limit_settings(config)
     return SECProvider(
         user_agent=config.get("user_agent", "SECWatcher/1.0 (research@example.com)"),
         timeout=config.get("timeout_sec", 30),
         retries=config.get("retries", 3),
-        request_interval=config.get("request_interval", DEFAULT_REQUEST_INTERVAL),
+        burst_capacity=burst_capacity,
+        requests_per_second=requests_per_second,
+        ticker_map_ttl=config.get("ticker_map_ttl_sec", DEFAULT_TICKER_MAP_TTL),
+        cache_dir=config.get("cache_dir"),
+        submissions_ttl=config.get("submissions_ttl_sec", DEFAULT_SUBMISSIONS_TTL),
+        cache_maxsize=config.get("filings_cache_size", DEFAULT_FILINGS_CACHE_SIZE),
+        cache_ttl_sec=config.get("filings_cache_ttl_sec", DEFAULT_FILINGS_CACHE_TTL),
+        # Discovery workers plus per-filing download/fetch workers can all
+        # hold a connection at once
+        pool_size=max(HTTP_POOL_SIZE, 2 * int(config.get("concurrency", 4))),
+        circuit_breaker_threshold=config.get(
+            "circuit_breaker_threshold", DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+        ),
+        circuit_breaker_cooldown=config.get(
+            "circuit_breaker_cooldown_sec", DEFAULT_CIRCUIT_BREAKER_COOLDOWN
+        ),
+        circuit_breaker_max_failures=config.get(
+            "circuit_breaker_max_failures", DEFAULT_CIRCUIT_BREAKER_MAX_FAILURES
+        ),
+        cik_cache_path=config.get(
+            "cik_cache_path",
+            os.path.join(config["state_dir"], "cik_cache.json") if config.get("state_dir") else None,
+        ),
     )
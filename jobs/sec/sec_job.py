@@ -34,12 +34,35 @@ import logging
 import os
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Watchlist files at least this large are stream-parsed when ijson is available
+WATCHLIST_STREAM_MIN_BYTES = 64 * 1024
+
 # Add the sec module to path
 SEC_DIR = Path(__file__).parent
 sys.path.insert(0, str(SEC_DIR))
@@ -47,13 +70,23 @@ sys.path.insert(0, str(SEC_DIR))
 from models import Company, Filing, FilingStatus, Watchlist, JobRun
 from state import StateStore, LocalStateStore, create_state_store
 from storage import FileStorage, create_storage
-from provider import SECProvider, SECFiling, create_provider
+from provider import RateLimitError, SECProvider, SECFiling, create_provider
 from processor import FilingProcessor, create_processor
 
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_tickers(companies: str) -> List[str]:
+    """
+    Split a comma-separated ticker string into upper-cased symbols.
+
+    Only commas separate symbols, so share-class tickers such as "BRK/B" or
+    "BRK B" stay one symbol; blank entries are dropped.
+    """
+    return [t for t in (t.strip() for t in companies.upper().split(",")) if t]
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -108,13 +141,80 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         if path.exists():
             logger.info(f"Loading config from {config_path}")
             with open(path) as f:
-                file_config = yaml.safe_load(f)
+                file_config = yaml.load(f, Loader=SafeLoader)
                 if file_config:
                     config.update(file_config)
 
     return config
 
 
+def _is_json_array(f) -> bool:
+    """Peek at the first non-whitespace byte of a binary file, then rewind."""
+    while True:
+        chunk = f.read(64)
+        if not chunk:
+            result = False
+            break
+        stripped = chunk.lstrip()
+        if stripped:
+            result = stripped[:1] == b"["
+            break
+    f.seek(0)
+    return result
+
+
+def _read_watchlist(f, size: int) -> Watchlist:
+    """
+    Parse a watchlist from a binary file object.
+
+    Args:
+        f: Seekable binary file (local file or GCS blob reader)
+        size: Size of the file in bytes
+
+    Returns:
+        Watchlist object
+    """
+    # Large ticker lists are streamed into Company objects
+    # without materializing the whole JSON document first
+    if HAS_IJSON and size >= WATCHLIST_STREAM_MIN_BYTES and _is_json_array(f):
+        return Watchlist.from_tickers(ijson.items(f, "item"))
+
+    data = _json_loads(f.read())
+    if isinstance(data, list):
+        # Simple list of tickers
+        return Watchlist.from_tickers(data)
+    return Watchlist.from_dict(data)
+
+
+def _load_gcs_watchlist(uri: str) -> Optional[Watchlist]:
+    """
+    Load a watchlist from a gs://bucket/path URI.
+
+    The blob is read through a chunked reader, so large list-form
+    watchlists are parsed as they download.
+
+    Returns:
+        Watchlist object, or None if the blob does not exist
+    """
+    try:
+        from google.cloud import storage
+    except ImportError:
+        raise ImportError(
+            "google-cloud-storage is required for gs:// watchlists. "
+            "Install with: pip install google-cloud-storage"
+        )
+
+    bucket_name, _, blob_name = uri[len("gs://"):].partition("/")
+    blob = storage.Client().bucket(bucket_name).get_blob(blob_name)
+    if blob is None:
+        logger.warning(f"Watchlist not found: {uri}")
+        return None
+
+    logger.info(f"Loading watchlist from {uri}")
+    with blob.open("rb", chunk_size=256 * 1024) as f:
+        return _read_watchlist(f, blob.size or 0)
+
+
 def load_watchlist(
     watchlist_path: Optional[str],
     companies: Optional[str],
@@ -124,7 +224,7 @@ def load_watchlist(
     Load watchlist from file or create from company list.
 
     Args:
-        watchlist_path: Path to watchlist JSON file
+        watchlist_path: Path or gs:// URI of a watchlist JSON file
         companies: Comma-separated list of tickers
         state: State store for persistent watchlist
 
@@ -133,21 +233,20 @@ def load_watchlist(
     """
     # If companies specified, create from list
     if companies:
-        tickers = [t.strip().upper() for t in companies.split(",") if t.strip()]
-        return Watchlist.from_tickers(tickers)
+        return Watchlist.from_tickers(_parse_tickers(companies))
 
-    # If watchlist path specified, load from file
+    # If watchlist path specified, load from file (local path or gs:// URI)
     if watchlist_path:
-        path = Path(watchlist_path)
-        if path.exists():
-            logger.info(f"Loading watchlist from {watchlist_path}")
-            with open(path) as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    # Simple list of tickers
-                    return Watchlist.from_tickers(data)
-                else:
-                    return Watchlist.from_dict(data)
+        if watchlist_path.startswith("gs://"):
+            watchlist = _load_gcs_watchlist(watchlist_path)
+            if watchlist is not None:
+                return watchlist
+        else:
+            path = Path(watchlist_path)
+            if path.exists():
+                logger.info(f"Loading watchlist from {watchlist_path}")
+                with open(path, "rb") as f:
+                    return _read_watchlist(f, path.stat().st_size)
 
     # Load from state store
     watchlist = state.load_watchlist()
@@ -165,6 +264,9 @@ def discover_filings(
     state: StateStore,
     mode: str = "default",
     backfill_years: int = 0,
+    preloaded_filings: Optional[List[SECFiling]] = None,
+    known_accessions: Optional[Set[Tuple[str, str]]] = None,
+    now: Optional[datetime] = None,
 ) -> List[Filing]:
     """
     Discover new filings for a company.
@@ -175,6 +277,11 @@ def discover_filings(
         state: State store
         mode: "default" or "backfill"
         backfill_years: Years to backfill (only in backfill mode)
+        preloaded_filings: Filings already fetched for this company by
+            prefetch_filings(); skips the per-company SEC request
+        known_accessions: (cik, accession_number) pairs already in state, from
+            state.known_accessions(); loaded for this company if None
+        now: Sync timestamp recorded on the company (defaults to current time)
 
     Returns:
         List of newly discovered filings
@@ -190,7 +297,9 @@ def discover_filings(
 
     discovered = []
 
-    if mode == "backfill":
+    if preloaded_filings is not None:
+        sec_filings = preloaded_filings
+    elif mode == "backfill":
         # Backfill mode: get all filings in time window
         logger.info(f"Backfilling {backfill_years} years for {company.ticker}")
         sec_filings = provider.get_backfill_filings(
@@ -206,30 +315,36 @@ def discover_filings(
         )
         sec_filings = [f for f in [latest_10k, latest_10q] if f]
 
-    # Check which filings are new
-    for sec_filing in sec_filings:
-        # Check if already in state
-        existing = state.get_filing(sec_filing.cik, sec_filing.accession_number)
-        if existing:
-            logger.debug(f"Filing {sec_filing.accession_number} already exists")
-            continue
-
-        # Check if newer than last seen
-        if mode == "default" and company.last_seen_filed_at:
-            if sec_filing.filed_at <= company.last_seen_filed_at:
-                logger.debug(f"Filing {sec_filing.accession_number} is not new")
-                continue
-
-        # Create new filing record
+    # Check which filings are new: not already in state and, in default
+    # mode, filed after the company's checkpoint
+    if known_accessions is None:
+        known_accessions = state.known_accessions(cik)
+    cutoff = company.last_seen_filed_at if mode == "default" else None
+    new_filings = [
+        f for f in sec_filings
+        if (f.cik, f.accession_number) not in known_accessions
+        and (cutoff is None or f.filed_at > cutoff)
+    ]
+    if len(new_filings) < len(sec_filings):
+        logger.debug(
+            f"{company.ticker}: skipped {len(sec_filings) - len(new_filings)} "
+            f"known or older filings"
+        )
+
+    for sec_filing in new_filings:
+        # Create new filing record (persisted in one batch below)
         filing = provider.to_filing_model(sec_filing, ticker=company.ticker)
-        state.upsert_filing(filing)
         discovered.append(filing)
+        known_accessions.add((filing.cik, filing.accession_number))
 
         logger.info(
             f"Discovered: {company.ticker} {filing.form_type} "
             f"filed {filing.filed_at.date()} ({filing.accession_number})"
         )
 
+    if discovered:
+        state.upsert_filings_bulk(discovered)
+
     # Update company checkpoint
     if sec_filings:
         newest = max(sec_filings, key=lambda f: (f.accepted_at or f.filed_at, f.accession_number))
@@ -238,17 +353,55 @@ def discover_filings(
             newest.filed_at,
         )
         company.last_seen_accession = newest.accession_number
-        company.last_sync_at = datetime.now(timezone.utc)
+        company.last_sync_at = now or datetime.now(timezone.utc)
 
     return discovered
 
 
+def prefetch_filings(
+    companies: List[Company],
+    provider: SECProvider,
+    mode: str = "default",
+    backfill_years: int = 0,
+    workers: Optional[int] = None,
+) -> Dict[str, List[SECFiling]]:
+    """
+    Fetch candidate filings for all companies in one concurrent batch.
+
+    Resolves missing CIKs first (one shared ticker map download), then
+    fetches every company's filings through the provider's bulk helpers.
+
+    Args:
+        companies: Companies to fetch for (CIKs are filled in on the objects)
+        provider: SEC API provider
+        mode: "default" or "backfill"
+        backfill_years: Years to backfill (only in backfill mode)
+        workers: Concurrent SEC requests
+
+    Returns:
+        Dict of CIK -> candidate filings, newest first
+    """
+    for company in companies:
+        if not company.cik:
+            company.cik = provider.lookup_cik(company.ticker)
+
+    ciks = list(dict.fromkeys(c.cik for c in companies if c.cik))
+    if mode == "backfill":
+        return provider.get_backfill_filings_many(
+            ciks, years=backfill_years, form_types=["10-K", "10-Q"], max_workers=workers,
+        )
+
+    latest = provider.get_latest_filings_many(ciks, workers=workers or 8)
+    return {cik: [f for f in pair if f] for cik, pair in latest.items()}
+
+
 def run_job(
     config: Dict[str, Any],
     watchlist: Watchlist,
     mode: str = "default",
     backfill_years: int = 0,
     dry_run: bool = False,
+    state: Optional[StateStore] = None,
 ) -> JobRun:
     """
     Run the SEC filing discovery and download job.
@@ -259,12 +412,14 @@ def run_job(
         mode: "default" or "backfill"
         backfill_years: Years to backfill
         dry_run: If True, only discover, don't download
+        state: State store to reuse (created from config if None)
 
     Returns:
         JobRun record with results
     """
     # Initialize components
-    state = create_state_store(config)
+    if state is None:
+        state = create_state_store(config)
     storage = create_storage(config)
     provider = create_provider(config)
     processor = create_processor(state, storage, provider, config)
@@ -272,7 +427,7 @@ def run_job(
     # Create job run record
     now = datetime.now(timezone.utc)
     run = JobRun(
-        run_id=f"run-{now.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}",
+        run_id=f"run-{now:%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}",
         started_at=now,
         mode=mode,
         backfill_years=backfill_years if mode == "backfill" else None,
@@ -290,32 +445,68 @@ def run_job(
         all_discovered: List[Filing] = []
 
         # Phase 1: Discover filings
-        for company in enabled_companies:
-            try:
-                discovered = discover_filings(
-                    company=company,
-                    provider=provider,
-                    state=state,
-                    mode=mode,
-                    backfill_years=backfill_years,
-                )
-                all_discovered.extend(discovered)
-                run.companies_processed += 1
-
-                # Update backfill status if in backfill mode
-                if mode == "backfill":
-                    company.backfill_completed_years = backfill_years
-                    company.backfill_completed_at = datetime.now(timezone.utc)
-
-            except Exception as e:
-                logger.error(f"Error discovering filings for {company.ticker}: {e}")
+        # SEC requests for all companies go out as one concurrent batch; the
+        # provider's shared token bucket keeps the request rate in check
+        workers = max(1, int(config.get("concurrency", 4)))
+        # One timestamp for every company synced in this phase
+        synced_at = datetime.now(timezone.utc)
+        prefetched = prefetch_filings(
+            enabled_companies, provider, mode, backfill_years, workers=workers,
+        )
+        # One index scan replaces a state lookup per candidate filing
+        known = state.known_accessions()
+
+        # Index writes from every company are deferred to a single flush
+        state.begin_batch()
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sec-discover") as executor:
+                futures = {
+                    executor.submit(
+                        discover_filings,
+                        company=company,
+                        provider=provider,
+                        state=state,
+                        mode=mode,
+                        backfill_years=backfill_years,
+                        preloaded_filings=prefetched.get(company.cik) if company.cik else None,
+                        known_accessions=known,
+                        now=synced_at,
+                    ): company
+                    for company in enabled_companies
+                }
+
+                for future in as_completed(futures):
+                    company = futures[future]
+                    try:
+                        discovered = future.result()
+                        all_discovered.extend(discovered)
+                        run.companies_processed += 1
+
+                        # Update backfill status if in backfill mode
+                        if mode == "backfill":
+                            company.backfill_completed_years = backfill_years
+                            company.backfill_completed_at = synced_at
+
+                    except Exception as e:
+                        logger.error(f"Error discovering filings for {company.ticker}: {e}")
+        finally:
+            state.commit_batch()
 
         run.filings_discovered = len(all_discovered)
         logger.info(f"Discovered {len(all_discovered)} new filings")
 
-        # Save updated watchlist
+        # Save updated watchlist: the single flush point for every company
+        # checkpoint changed above (filing upserts never rewrite it)
         state.save_watchlist(watchlist)
 
+        # SEC is throttling us: downloads would fail fast and burn each
+        # filing's retry budget, so leave them DISCOVERED for the next run
+        if provider.circuit_open:
+            raise RateLimitError(
+                "rate-limit circuit open; SEC is throttling requests, "
+                "skipping download phase"
+            )
+
         # Phase 2: Process discovered filings
         if not dry_run and all_discovered:
             logger.info("=" * 70)
@@ -337,6 +528,7 @@ def run_job(
         run.error_message = str(e)
 
     finally:
+        processor.close()
         run.completed_at = datetime.now(timezone.utc)
         state.save_job_run(run)
 
@@ -377,6 +569,7 @@ def cmd_run(args: argparse.Namespace) -> int:
         mode=mode,
         backfill_years=args.backfill_years or 0,
         dry_run=args.dry_run,
+        state=state,
     )
 
     return 0 if run.success else 1
@@ -414,10 +607,11 @@ def cmd_status(args: argparse.Namespace) -> int:
 
     # Show filing counts by status
     print("\nFilings by Status:")
+    counts = state.count_filings_by_status()
     for status in FilingStatus:
-        filings = state.get_filings_by_status(status)
-        if filings:
-            print(f"  {status.value}: {len(filings)}")
+        count = counts.get(status.value, 0)
+        if count:
+            print(f"  {status.value}: {count}")
 
     return 0
 
@@ -433,16 +627,21 @@ def cmd_add(args: argparse.Namespace) -> int:
         print("No companies specified. Use --companies AAPL,MSFT,GOOGL")
         return 1
 
-    tickers = [t.strip().upper() for t in args.companies.split(",") if t.strip()]
+    tickers = _parse_tickers(args.companies)
+    by_ticker = {c.ticker.upper(): c for c in watchlist.companies}
 
     for ticker in tickers:
-        existing = watchlist.get_by_ticker(ticker)
-        if existing:
+        if ticker in by_ticker:
             print(f"  {ticker}: already in watchlist")
         else:
-            watchlist.add_company(Company(ticker=ticker))
+            # by_ticker already rules out duplicates, so skip add_company's scan
+            company = Company(ticker=ticker)
+            watchlist.companies.append(company)
+            by_ticker[ticker] = company
             print(f"  {ticker}: added")
 
+    watchlist.updated_at = datetime.utcnow()
+
     state.save_watchlist(watchlist)
     print(f"\nWatchlist now has {len(watchlist.companies)} companies")
 
@@ -460,16 +659,23 @@ def cmd_remove(args: argparse.Namespace) -> int:
         print("No companies specified. Use --companies AAPL,MSFT")
         return 1
 
-    tickers = [t.strip().upper() for t in args.companies.split(",")]
+    tickers = _parse_tickers(args.companies)
+    remaining = {c.ticker.upper() for c in watchlist.companies}
+    removed = set()
 
     for ticker in tickers:
-        existing = watchlist.get_by_ticker(ticker)
-        if existing:
-            watchlist.companies.remove(existing)
+        if ticker in remaining:
+            remaining.discard(ticker)
+            removed.add(ticker)
             print(f"  {ticker}: removed")
         else:
             print(f"  {ticker}: not in watchlist")
 
+    if removed:
+        watchlist.companies = [
+            c for c in watchlist.companies if c.ticker.upper() not in removed
+        ]
+
     state.save_watchlist(watchlist)
     print(f"\nWatchlist now has {len(watchlist.companies)} companies")
 
@@ -11,22 +11,224 @@ Supports both local JSON files and GCS for cloud deployment.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import mmap
 import os
-import shutil
+import pickle
+import socket
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import Counter, OrderedDict, defaultdict
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import uuid
+from typing import Dict, List, NamedTuple, Optional, Any, Set, Tuple
 import fcntl
 
 from models import Company, Filing, FilingStatus, Watchlist, JobRun
+from storage import create_temp_file
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
 
 
 logger = logging.getLogger(__name__)
 
+# Filing records kept in memory per state store (least recently used evicted)
+DEFAULT_FILING_CACHE_SIZE = 4096
+
+# Bulk queries read (and GCS bulk upserts upload) filing records on a thread
+# pool once they cover more than PARALLEL_READ_MIN records (file/blob I/O
+# releases the GIL)
+LOCAL_READ_WORKERS = 16
+GCS_IO_WORKERS = 32
+PARALLEL_READ_MIN = 8
+
+# State files at least this large are parsed straight from an mmap of the
+# file instead of a read() copy (orjson only; below this the syscalls dominate)
+MMAP_READ_MIN_BYTES = 64 * 1024
+
+# A claim file older than this (seconds) is treated as abandoned and taken
+# over, even if its PID is alive (or on another host)
+DEFAULT_CLAIM_TIMEOUT = 3600
+
+# Upserts and claims lock one of this many stripes (chosen by filing key) so
+# writers of different filings do not serialize on one lock
+KEY_LOCK_SHARDS = 256
+
+# Local filing records can be stored as MessagePack (state_format: msgpack);
+# the file suffix tells readers which encoding a record uses
+STATE_FORMATS = ("json", "msgpack")
+MSGPACK_SUFFIX = ".msgpack"
+
+# index.log is folded into index.json once it has more lines than this and
+# more than twice the number of distinct filings
+INDEX_COMPACT_MIN_LINES = 1000
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize state to UTF-8 JSON (orjson when available).
+
+    State files are machine-read, so they are compact unless `pretty` is set
+    (the watchlist, which people edit by hand).
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, default=str).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize one compact JSON Lines record."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str) + b"\n"
+    return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+
+def _json_loads(content: bytes | str) -> Any:
+    """Parse JSON state (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _msgpack_dumps(data: Any) -> bytes:
+    """Serialize a state record to MessagePack."""
+    return msgpack.packb(data, default=str, use_bin_type=True)
+
+
+def _msgpack_loads(content: bytes) -> Any:
+    """Parse a MessagePack state record."""
+    return msgpack.unpackb(content, raw=False)
+
+
+def _is_msgpack(path: str | Path) -> bool:
+    return str(path).endswith(MSGPACK_SUFFIX)
+
+
+def dump_pretty(path: str | Path) -> str:
+    """
+    Return a local state file (JSON or MessagePack) as indented JSON.
+
+    Example:
+        python -c "from state import dump_pretty; print(dump_pretty('state/filings/index.json'))"
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    data = _msgpack_loads(content) if _is_msgpack(path) else _json_loads(content)
+    return _json_dumps(data, pretty=True).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=DEFAULT_FILING_CACHE_SIZE)
+def _filing_basename_for(ticker: str, form_type: str, filed_ordinal: Optional[int]) -> str:
+    """
+    Build `{TICKER}-{FORM_TYPE}-{FILED_DATE}` (memoized; shared by both stores).
+
+    The filed date is passed as a proleptic ordinal (`datetime.toordinal()`),
+    which is cheaper to produce and hash than a date object.
+    """
+    if filed_ordinal is None:
+        filed = "unknown"
+    else:
+        d = date.fromordinal(filed_ordinal)
+        filed = f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+    return f"{ticker.upper()}-{form_type.replace('/', '-')}-{filed}"
+
+
+def _run_filename(run: JobRun) -> str:
+    """
+    Name a job run file so that names sort by start time.
+
+    ``{started_at UTC, YYYYmmddTHHMMSSffffff}-{run_id}.json``; naive
+    timestamps are taken as UTC.
+    """
+    started = run.started_at
+    if started.tzinfo is not None:
+        started = started.astimezone(timezone.utc)
+    return f"{started:%Y%m%dT%H%M%S%f}-{run.run_id}.json"
+
+
+def _is_timestamped_run(name: str) -> bool:
+    """True for run files named by _run_filename (older files start with the run_id)."""
+    return name[:1].isdigit() and name.endswith(".json")
+
+
+class IndexEntry(NamedTuple):
+    """
+    One local filing index entry.
+
+    Stored as a tuple rather than a dict: a large index holds one of these
+    per filing, and tuples are about a quarter of the size.
+    """
+    cik: str
+    accession: str
+    ticker: Optional[str] = None
+    status: Optional[str] = None
+    form_type: Optional[str] = None
+    filed_at: Optional[str] = None
+    file_path: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndexEntry":
+        return cls(
+            data["cik"],
+            data["accession"],
+            data.get("ticker"),
+            data.get("status"),
+            data.get("form_type"),
+            data.get("filed_at"),
+            data.get("file_path"),
+        )
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry past `maxsize`."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value and mark it most recently used, or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Return the value without changing its recency, or None."""
+        return self._data.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value as most recently used, evicting if over capacity."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 class StateStore(ABC):
     """Abstract base class for state persistence."""
@@ -61,6 +263,16 @@ class StateStore(ABC):
         """Get all filings for a company."""
         pass
 
+    @abstractmethod
+    def count_filings_by_status(self) -> Dict[str, int]:
+        """Count filings per status value without loading the filings."""
+        pass
+
+    @abstractmethod
+    def known_accessions(self, cik: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """Get (cik, accession_number) for every filing in state, optionally for one company."""
+        pass
+
     @abstractmethod
     def save_job_run(self, run: JobRun) -> None:
         """Save a job run record."""
@@ -71,6 +283,38 @@ class StateStore(ABC):
         """Get the most recent job run."""
         pass
 
+    def begin_batch(self) -> None:
+        """
+        Start a batch of filing upserts.
+
+        Stores may defer index writes until commit_batch(). Batches nest;
+        only the outermost commit_batch() flushes.
+        """
+        pass
+
+    def commit_batch(self) -> None:
+        """Flush writes deferred since begin_batch()."""
+        pass
+
+    def _key_lock(self, key: str) -> threading.RLock:
+        """Lock stripe guarding one filing key (stores create `_key_locks`)."""
+        return self._key_locks[hash(key) & (KEY_LOCK_SHARDS - 1)]
+
+    @contextmanager
+    def batch(self):
+        """Context manager around begin_batch() / commit_batch()."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.commit_batch()
+
+    def upsert_filings_bulk(self, filings: List[Filing]) -> None:
+        """Insert or update several filings, flushing the index once."""
+        with self.batch():
+            for filing in filings:
+                self.upsert_filing(filing)
+
 
 class LocalStateStore(StateStore):
     """
@@ -79,193 +323,615 @@ class LocalStateStore(StateStore):
     Directory structure:
     state_dir/
     ├── watchlist.json          # Company watchlist
+    ├── .cache/
+    │   └── watchlist.pkl       # Parsed watchlist keyed on watchlist.json stat
     ├── filings/
-    │   ├── index.json          # Filing index (key -> minimal info + file_path)
+    │   ├── index.json          # Filing index snapshot (key -> minimal info + file_path)
+    │   ├── index.log           # Index entries appended since the last compaction (JSONL)
     │   └── {ticker}/
     │       └── {ticker}-{form_type}-{filed_date}.json
+    ├── claims/
+    │   └── {cik}_{accession}.lock  # Held while a worker is downloading the filing
     └── runs/
-        └── {run_id}.json
+        └── {started_at}-{run_id}.json
     """
 
-    def __init__(self, state_dir: str | Path):
+    def __init__(
+        self,
+        state_dir: str | Path,
+        durability: str = "normal",
+        filing_cache_size: int = DEFAULT_FILING_CACHE_SIZE,
+        state_format: str = "json",
+        claim_timeout: float = DEFAULT_CLAIM_TIMEOUT,
+    ):
+        """
+        Initialize local state store.
+
+        Args:
+            state_dir: Root directory for state files
+            durability: "normal" relies on atomic renames only; "full" also
+                fsyncs each file and its directory before returning
+            filing_cache_size: Filing records kept in memory (LRU, 0 disables)
+            state_format: Encoding for filing records, "json" or "msgpack"
+                (needs the msgpack package). Existing records in the other
+                format stay readable and are converted when next upserted.
+            claim_timeout: Seconds after which another worker's claim is
+                considered abandoned (claims of dead local PIDs are taken
+                over immediately)
+        """
+        if durability not in ("normal", "full"):
+            raise ValueError(f"Unknown durability: {durability}")
+        if state_format not in STATE_FORMATS:
+            raise ValueError(f"Unknown state_format: {state_format}")
+        if state_format == "msgpack" and not HAS_MSGPACK:
+            logger.warning("msgpack not installed, writing filing state as JSON")
+            state_format = "json"
         self.state_dir = Path(state_dir)
+        self.durability = durability
+        self.state_format = state_format
+        self.claim_timeout = claim_timeout
+        self._filing_suffix = MSGPACK_SUFFIX if state_format == "msgpack" else ".json"
         self._ensure_dirs()
-        self._filing_cache: Dict[str, Filing] = {}
+        self._filing_cache = LRUCache(filing_cache_size)
+        self._key_locks = [threading.RLock() for _ in range(KEY_LOCK_SHARDS)]
+        # Ticker directories already created under filings/ (skips a mkdir per upsert)
+        self._known_ticker_dirs: Set[str] = set()
+        # Guards index read-modify-write; upserts come from worker threads
+        self._index_lock = threading.RLock()
+        self._batch_depth = 0
+        # Index entries upserted during an open batch, not yet appended
+        self._pending_index: Dict[str, IndexEntry] = {}
+        # Directories holding filing files written in the open batch whose
+        # fsync (durability "full") is deferred to commit
+        self._pending_sync_dirs: Set[Path] = set()
+        # Merged index.json + index.log, reused while both files' stat keys
+        # are unchanged
+        self._index_cache: Optional[Dict[str, IndexEntry]] = None
+        self._index_stat: Optional[tuple] = None
+        self._index_log_lines = 0
+        # Secondary lookups over _index_cache: status value / CIK -> keys
+        # (dicts used as insertion-ordered sets)
+        self._by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._by_cik: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Unbuffered O_APPEND handle on index.log, kept open across upserts
+        self._index_log_file = None
 
     def _ensure_dirs(self) -> None:
         """Create required directories."""
         self.state_dir.mkdir(parents=True, exist_ok=True)
         (self.state_dir / "filings").mkdir(exist_ok=True)
         (self.state_dir / "runs").mkdir(exist_ok=True)
+        (self.state_dir / "claims").mkdir(exist_ok=True)
+
+    def _claim_path(self, cik: str, accession: str) -> Path:
+        return self.state_dir / "claims" / f"{cik}_{accession}.lock"
+
+    def _release_claim(self, cik: str, accession: str) -> None:
+        try:
+            self._claim_path(cik, accession).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _claim_is_stale(self, claim_path: Path) -> bool:
+        """
+        Whether a claim was abandoned: older than claim_timeout, or written
+        on this host by a PID that no longer exists.
+        """
+        try:
+            age = time.time() - claim_path.stat().st_mtime
+            owner = claim_path.read_text().split()
+        except FileNotFoundError:
+            # Released meanwhile; the caller retries the link
+            return True
+        if age > self.claim_timeout:
+            return True
+        if len(owner) < 2 or owner[1] != socket.gethostname():
+            return False
+        try:
+            os.kill(int(owner[0]), 0)
+        except ProcessLookupError:
+            return True
+        except (PermissionError, ValueError):
+            pass
+        return False
+
+    @contextmanager
+    def _claims_file_lock(self):
+        """Cross-process lock serializing takeovers of stale claims."""
+        with open(self.state_dir / "claims" / ".lock", "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
     def _watchlist_path(self) -> Path:
         return self.state_dir / "watchlist.json"
 
+    def _watchlist_cache_path(self) -> Path:
+        return self.state_dir / ".cache" / "watchlist.pkl"
+
     def _filing_index_path(self) -> Path:
         return self.state_dir / "filings" / "index.json"
 
+    def _filing_index_log_path(self) -> Path:
+        return self.state_dir / "filings" / "index.log"
+
+    def _filing_index_lock_path(self) -> Path:
+        return self.state_dir / "filings" / "index.lock"
+
     def _filing_basename(self, filing: Filing) -> str:
         """
         Generate base filename for a filing state.
         Format: {TICKER}-{FORM_TYPE}-{FILED_DATE}
         Example: AAPL-10-K-2025-01-31
         """
-        ticker = (filing.ticker or filing.cik).upper()
-        form_type = filing.form_type.replace("/", "-")
-        filed_date = filing.filed_at.strftime("%Y-%m-%d") if filing.filed_at else "unknown"
-        return f"{ticker}-{form_type}-{filed_date}"
+        return _filing_basename_for(
+            filing.ticker or filing.cik,
+            filing.form_type,
+            filing.filed_at.toordinal() if filing.filed_at else None,
+        )
 
     def _ticker_dir(self, filing: Filing) -> Path:
         """Get directory for a ticker (e.g., state/filings/AAPL/)."""
         ticker = (filing.ticker or filing.cik).upper()
         dir_path = self.state_dir / "filings" / ticker
-        dir_path.mkdir(parents=True, exist_ok=True)
+        if ticker not in self._known_ticker_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._known_ticker_dirs.add(ticker)
         return dir_path
 
     def _filing_path_from_filing(self, filing: Filing) -> Path:
         """Build filing state file path from Filing object."""
         ticker_dir = self._ticker_dir(filing)
         basename = self._filing_basename(filing)
-        return ticker_dir / f"{basename}.json"
+        return ticker_dir / f"{basename}{self._filing_suffix}"
 
     def _filing_path_from_index(self, cik: str, accession: str) -> Optional[Path]:
         """Look up filing path from index."""
         index = self._load_filing_index()
         key = f"{cik}:{accession}"
-        if key in index and "file_path" in index[key]:
-            return self.state_dir / "filings" / index[key]["file_path"]
+        entry = index.get(key)
+        if entry is not None and entry.file_path:
+            return self.state_dir / "filings" / entry.file_path
         return None
 
-    def _run_path(self, run_id: str) -> Path:
-        return self.state_dir / "runs" / f"{run_id}.json"
+    def _run_path(self, run: JobRun) -> Path:
+        return self.state_dir / "runs" / _run_filename(run)
 
     def _read_json(self, path: Path) -> Optional[Dict]:
-        """Read JSON file with file locking."""
-        if not path.exists():
-            return None
+        """Read a JSON (or, for .msgpack paths, MessagePack) state file with file locking."""
         try:
-            with open(path, "r") as f:
+            with open(path, "rb") as f:
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
-                    return json.load(f)
+                    if _is_msgpack(path):
+                        return _msgpack_loads(f.read())
+                    if HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_READ_MIN_BYTES:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            with memoryview(mm) as view:
+                                return orjson.loads(view)
+                    return _json_loads(f.read())
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {path}: {e}")
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Invalid state file {path}: {e}")
             return None
 
-    def _write_json(self, path: Path, data: Dict) -> None:
-        """Write JSON file atomically with file locking."""
-        # Use unique temp file to avoid race conditions with concurrent writes
-        tmp_path = path.with_suffix(f".tmp.{uuid.uuid4().hex[:8]}")
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist a rename by fsyncing the containing directory."""
+        fd = os.open(directory, os.O_RDONLY)
         try:
-            with open(tmp_path, "w") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(data, f, indent=2, default=str)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            shutil.move(str(tmp_path), str(path))
-        except Exception as e:
-            if tmp_path.exists():
-                tmp_path.unlink()
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _write_json(
+        self, path: Path, data: Dict, sync_dir: bool = True, pretty: bool = False
+    ) -> None:
+        """
+        Write JSON file atomically via a sibling temp file and rename.
+
+        With durability "full", sync_dir=False leaves the directory fsync to
+        the caller (batches sync each touched directory once at commit).
+        """
+        fd, tmp_path = create_temp_file(path.parent, prefix=path.name + ".")
+        try:
+            content = _msgpack_dumps(data) if _is_msgpack(path) else _json_dumps(data, pretty)
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                if self.durability == "full":
+                    f.flush()
+                    os.fsync(f.fileno())
+            # rename(2) within the directory: readers see old or new, never partial
+            os.replace(tmp_path, path)
+            if self.durability == "full" and sync_dir:
+                self._fsync_dir(path.parent)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
             raise
 
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[tuple]:
+        """Identify a file version; atomic replaces change the inode."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _read_watchlist_cache(self, stat_key: tuple) -> Optional[Watchlist]:
+        """Return the pickled watchlist if it was built from the current file."""
+        try:
+            with open(self._watchlist_cache_path(), "rb") as f:
+                cached_key, watchlist = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable watchlist cache: {e}")
+            return None
+        return watchlist if cached_key == stat_key else None
+
+    def _write_watchlist_cache(self, stat_key: tuple, watchlist: Watchlist) -> None:
+        cache_path = self._watchlist_cache_path()
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = create_temp_file(cache_path.parent, prefix=cache_path.name + ".")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stat_key, watchlist), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Failed to write watchlist cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     def load_watchlist(self) -> Watchlist:
-        """Load the company watchlist."""
-        data = self._read_json(self._watchlist_path())
-        if data:
-            return Watchlist.from_dict(data)
-        return Watchlist()
+        """Load the company watchlist.
+
+        The parsed watchlist is pickled under ``.cache/`` keyed on the JSON
+        file's (mtime_ns, size), so repeat invocations skip re-parsing.
+        """
+        path = self._watchlist_path()
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            return Watchlist()
+
+        cached = self._read_watchlist_cache(stat_key)
+        if cached is not None:
+            return cached
+
+        data = self._read_json(path)
+        if not data:
+            return Watchlist()
+        watchlist = Watchlist.from_dict(data)
+        self._write_watchlist_cache(stat_key, watchlist)
+        return watchlist
 
     def save_watchlist(self, watchlist: Watchlist) -> None:
         """Save the company watchlist."""
-        self._write_json(self._watchlist_path(), watchlist.to_dict())
+        path = self._watchlist_path()
+        self._write_json(path, watchlist.to_dict(), pretty=True)
+        stat_key = self._stat_key(path)
+        if stat_key is not None:
+            self._write_watchlist_cache(stat_key, watchlist)
         logger.debug(f"Saved watchlist with {len(watchlist.companies)} companies")
 
-    def _load_filing_index(self) -> Dict[str, Dict[str, str]]:
-        """Load the filing index (key -> {cik, accession, status})."""
-        data = self._read_json(self._filing_index_path())
-        return data or {}
+    def _index_stat_key(self) -> tuple:
+        return (
+            self._stat_key(self._filing_index_path()),
+            self._stat_key(self._filing_index_log_path()),
+        )
+
+    @contextmanager
+    def _index_file_lock(self, exclusive: bool):
+        """Cross-process lock over index.json + index.log (shared for reads)."""
+        with open(self._filing_index_lock_path(), "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_index_from_disk(self) -> Tuple[Dict[str, IndexEntry], int]:
+        """
+        Build the index from the snapshot plus the append log (caller holds
+        the index file lock).
 
-    def _save_filing_index(self, index: Dict[str, Dict[str, str]]) -> None:
-        """Save the filing index."""
-        self._write_json(self._filing_index_path(), index)
+        Returns:
+            Tuple of (index, number of log lines replayed)
+        """
+        snapshot = self._read_json(self._filing_index_path()) or {}
+        index = {key: IndexEntry.from_dict(info) for key, info in snapshot.items()}
+        lines = 0
+        try:
+            with open(self._filing_index_log_path(), "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _json_loads(line)
+                    except ValueError:
+                        # Torn final line from a crashed writer
+                        logger.warning("Skipping unreadable filing index log line")
+                        continue
+                    index[record["key"]] = IndexEntry.from_dict(record["entry"])
+                    lines += 1
+        except FileNotFoundError:
+            pass
+        return index, lines
+
+    def _load_filing_index(self) -> Dict[str, IndexEntry]:
+        """
+        Load the filing index (key -> {cik, accession, status}).
+
+        The index is index.json plus the entries appended to index.log since
+        the last compaction. The merged dict is kept in memory and only
+        rebuilt when either file changes on disk (e.g. another process wrote
+        it). Entries upserted in an open batch are overlaid until committed.
+        """
+        with self._index_lock:
+            stat_key = self._index_stat_key()
+            if self._index_cache is None or stat_key != self._index_stat:
+                with self._index_file_lock(exclusive=False):
+                    stat_key = self._index_stat_key()
+                    index, self._index_log_lines = self._read_index_from_disk()
+                index.update(self._pending_index)
+                self._set_index_cache(index)
+                self._index_stat = stat_key
+            return self._index_cache
+
+    def _set_index_cache(self, index: Dict[str, IndexEntry]) -> None:
+        """Install a freshly built index and rebuild the status/CIK lookups."""
+        by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+        by_cik: Dict[str, Dict[str, None]] = defaultdict(dict)
+        for key, info in index.items():
+            by_status[info.status][key] = None
+            by_cik[info.cik][key] = None
+        self._index_cache = index
+        # Rebuilt in place so callers holding a reference see the new lookups
+        self._by_status.clear()
+        self._by_status.update(by_status)
+        self._by_cik.clear()
+        self._by_cik.update(by_cik)
+
+    def _index_put(self, key: str, entry: IndexEntry) -> None:
+        """Set one index entry, keeping the status/CIK lookups in step."""
+        index = self._load_filing_index()
+        old = index.get(key)
+        if old is not None:
+            self._by_status[old.status].pop(key, None)
+            self._by_cik[old.cik].pop(key, None)
+        index[key] = entry
+        self._by_status[entry.status][key] = None
+        self._by_cik[entry.cik][key] = None
+
+    def _index_keys(self, by: Dict[str, Dict[str, None]], value: str) -> List[str]:
+        """Snapshot the index keys for one status or CIK."""
+        with self._index_lock:
+            self._load_filing_index()
+            return list(by.get(value, ()))
+
+    def _append_index_entries(self, entries: Dict[str, IndexEntry]) -> None:
+        """Append index entries to index.log in one write, compacting if it has grown."""
+        payload = b"".join(
+            _json_line({"key": key, "entry": entry._asdict()}) for key, entry in entries.items()
+        )
+        with self._index_lock, self._index_file_lock(exclusive=True):
+            # Only keep the cache if nobody else wrote since we loaded it
+            up_to_date = self._index_stat == self._index_stat_key()
+            f = self._open_index_log()
+            # Start on a fresh line if a crashed writer left a torn record
+            size = os.fstat(f.fileno()).st_size
+            if size and os.pread(f.fileno(), 1, size - 1) != b"\n":
+                payload = b"\n" + payload
+            # O_APPEND + unbuffered: the batch normally lands in one write(2)
+            view = memoryview(payload)
+            while view:
+                view = view[f.write(view):]
+            if self.durability == "full":
+                os.fsync(f.fileno())
+            self._index_log_lines += len(entries)
+            self._index_stat = self._index_stat_key() if up_to_date else None
+
+            index_size = len(self._index_cache or {})
+            if self._index_log_lines > max(INDEX_COMPACT_MIN_LINES, 2 * index_size):
+                self._compact_index_locked()
+
+    def _open_index_log(self):
+        """Return the append handle on index.log, reopening it if the file was replaced."""
+        log_path = self._filing_index_log_path()
+        f = self._index_log_file
+        if f is not None:
+            try:
+                if os.stat(log_path).st_ino == os.fstat(f.fileno()).st_ino:
+                    return f
+            except FileNotFoundError:
+                pass
+            f.close()
+        self._index_log_file = open(log_path, "a+b", buffering=0)
+        return self._index_log_file
+
+    def _compact_index_locked(self) -> None:
+        """Fold index.log into index.json (caller holds both index locks)."""
+        index, _ = self._read_index_from_disk()
+        self._write_json(
+            self._filing_index_path(), {key: entry._asdict() for key, entry in index.items()}
+        )
+        # A crash before this truncate only means replaying entries that are
+        # already in the snapshot, which is harmless
+        with open(self._filing_index_log_path(), "wb"):
+            pass
+        if self.durability == "full":
+            self._fsync_dir(self._filing_index_log_path().parent)
+        index.update(self._pending_index)
+        self._set_index_cache(index)
+        self._index_log_lines = 0
+        self._index_stat = self._index_stat_key()
+        logger.debug(f"Compacted filing index ({len(index)} entries)")
+
+    def compact_index(self) -> None:
+        """Rewrite index.json from the snapshot plus log and clear the log."""
+        with self._index_lock, self._index_file_lock(exclusive=True):
+            self._compact_index_locked()
+
+    def begin_batch(self) -> None:
+        """Start deferring index appends; entries are held in memory."""
+        with self._index_lock:
+            self._batch_depth += 1
+
+    def commit_batch(self) -> None:
+        """Sync batched filing directories, then append every batched index entry in one write."""
+        with self._index_lock:
+            if self._batch_depth == 0:
+                return
+            self._batch_depth -= 1
+            if self._batch_depth:
+                return
+            if self.durability == "full":
+                # One fsync per touched directory, before the index points at
+                # the files
+                for dir_path in self._pending_sync_dirs:
+                    self._fsync_dir(dir_path)
+            self._pending_sync_dirs.clear()
+            if self._pending_index:
+                pending, self._pending_index = self._pending_index, {}
+                self._append_index_entries(pending)
 
     def get_filing(self, cik: str, accession_number: str) -> Optional[Filing]:
         """Get a filing by its unique key."""
+        return self._get_filing(cik, accession_number)
+
+    def _get_filing(
+        self, cik: str, accession_number: str, populate: bool = True
+    ) -> Optional[Filing]:
+        """
+        Get a filing through the LRU cache.
+
+        Bulk scans pass populate=False so a pass over every filing neither
+        reorders nor evicts the entries point lookups keep hot.
+        """
         key = f"{cik}:{accession_number}"
 
         # Check cache first
-        if key in self._filing_cache:
-            return self._filing_cache[key]
+        filing = self._filing_cache.get(key) if populate else self._filing_cache.peek(key)
+        if filing is not None:
+            return filing
 
         # Look up path from index
         path = self._filing_path_from_index(cik, accession_number)
-        if path and path.exists():
+        if path:
             data = self._read_json(path)
             if data:
                 filing = Filing.from_dict(data)
-                self._filing_cache[key] = filing
+                if populate:
+                    self._filing_cache.set(key, filing)
                 return filing
         return None
 
     def upsert_filing(self, filing: Filing) -> None:
         """Insert or update a filing."""
         key = filing.key
-        path = self._filing_path_from_filing(filing)
+        # Per-key lock: the file write and index entry for one filing stay in
+        # order, while upserts of different filings proceed in parallel
+        with self._key_lock(key):
+            path = self._filing_path_from_filing(filing)
+
+            # Get relative path for index storage
+            relative_path = path.relative_to(self.state_dir / "filings")
+
+            # Write filing data; inside a batch the directory fsync is grouped
+            # into commit_batch()
+            in_batch = self._batch_depth > 0
+            self._write_json(path, filing.to_dict(), sync_dir=not in_batch)
+
+            # Update index with file_path for lookup
+            entry = IndexEntry(
+                cik=filing.cik,
+                accession=filing.accession_number,
+                ticker=filing.ticker,
+                status=filing.status.value,
+                form_type=filing.form_type,
+                filed_at=filing.filed_at.isoformat() if filing.filed_at else None,
+                file_path=str(relative_path),  # Store path for lookup
+            )
+            with self._index_lock:
+                previous = self._load_filing_index().get(key)
+                self._index_put(key, entry)
+                if self._batch_depth:
+                    self._pending_index[key] = entry
+                    if in_batch:
+                        self._pending_sync_dirs.add(path.parent)
+                else:
+                    if in_batch and self.durability == "full":
+                        # The batch committed while this file was being written
+                        self._fsync_dir(path.parent)
+                    self._append_index_entries({key: entry})
+
+            if (
+                previous
+                and previous.status == FilingStatus.DOWNLOADING.value
+                and filing.status != FilingStatus.DOWNLOADING
+            ):
+                self._release_claim(filing.cik, filing.accession_number)
+
+            # Drop the record's old file if it moved (e.g. converted to another
+            # state_format)
+            if previous and previous.file_path not in (None, entry.file_path):
+                try:
+                    (self.state_dir / "filings" / previous.file_path).unlink()
+                except FileNotFoundError:
+                    pass
 
-        # Get relative path for index storage
-        relative_path = path.relative_to(self.state_dir / "filings")
+            # Update cache
+            self._filing_cache.set(key, filing)
 
-        # Write filing data
-        self._write_json(path, filing.to_dict())
+            logger.debug(f"Upserted filing {key} with status {filing.status.value}")
 
-        # Update index with file_path for lookup
-        index = self._load_filing_index()
-        index[key] = {
-            "cik": filing.cik,
-            "accession": filing.accession_number,
-            "ticker": filing.ticker,
-            "status": filing.status.value,
-            "form_type": filing.form_type,
-            "filed_at": filing.filed_at.isoformat() if filing.filed_at else None,
-            "file_path": str(relative_path),  # Store path for lookup
-        }
-        self._save_filing_index(index)
-
-        # Update cache
-        self._filing_cache[key] = filing
+    def _get_filings(self, keys: List[str]) -> List[Filing]:
+        """Read many filings by index key, in order, skipping missing ones."""
+        def read(key: str) -> Optional[Filing]:
+            cik, _, accession = key.partition(":")
+            return self._get_filing(cik, accession, populate=False)
 
-        logger.debug(f"Upserted filing {key} with status {filing.status.value}")
+        if len(keys) <= PARALLEL_READ_MIN:
+            results = map(read, keys)
+        else:
+            with ThreadPoolExecutor(max_workers=LOCAL_READ_WORKERS) as executor:
+                results = list(executor.map(read, keys))
+        return [filing for filing in results if filing]
 
     def get_filings_by_status(self, status: FilingStatus) -> List[Filing]:
         """Get all filings with a specific status."""
-        index = self._load_filing_index()
-        filings = []
-
-        for key, info in index.items():
-            if info.get("status") == status.value:
-                cik = info["cik"]
-                accession = info["accession"]
-                filing = self.get_filing(cik, accession)
-                if filing:
-                    filings.append(filing)
-
-        return filings
+        return self._get_filings(self._index_keys(self._by_status, status.value))
 
     def get_filings_for_company(self, cik: str) -> List[Filing]:
         """Get all filings for a company."""
+        return self._get_filings(self._index_keys(self._by_cik, cik))
+
+    def count_filings_by_status(self) -> Dict[str, int]:
+        """Count filings per status value from the index alone."""
+        with self._index_lock:
+            self._load_filing_index()
+            return {status: len(keys) for status, keys in self._by_status.items() if keys}
+
+    def known_accessions(self, cik: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """Get (cik, accession_number) for every filing in state, optionally for one company."""
+        if cik is not None:
+            return {
+                (cik, key.partition(":")[2]) for key in self._index_keys(self._by_cik, cik)
+            }
         index = self._load_filing_index()
-        filings = []
-
-        for key, info in index.items():
-            if info.get("cik") == cik:
-                filing = self.get_filing(cik, info["accession"])
-                if filing:
-                    filings.append(filing)
-
-        return filings
+        return {
+            (info.cik, info.accession)
+            for info in list(index.values())
+        }
 
     def filing_exists(self, cik: str, accession_number: str) -> bool:
         """Check if a filing already exists in state."""
@@ -275,25 +941,39 @@ class LocalStateStore(StateStore):
 
     def save_job_run(self, run: JobRun) -> None:
         """Save a job run record."""
-        path = self._run_path(run.run_id)
+        path = self._run_path(run)
         self._write_json(path, run.to_dict())
         logger.debug(f"Saved job run {run.run_id}")
 
     def get_last_job_run(self) -> Optional[JobRun]:
-        """Get the most recent job run."""
+        """
+        Get the most recent job run.
+
+        Run files are named by start time, so the newest is found from the
+        directory listing alone and only that file is parsed.
+        """
         runs_dir = self.state_dir / "runs"
-        if not runs_dir.exists():
+        try:
+            names = [entry.name for entry in os.scandir(runs_dir)]
+        except FileNotFoundError:
             return None
 
-        run_files = sorted(runs_dir.glob("*.json"), reverse=True)
-        if not run_files:
-            return None
+        for name in sorted(filter(_is_timestamped_run, names), reverse=True):
+            data = self._read_json(runs_dir / name)
+            if data:
+                return JobRun.from_dict(data)
 
-        # Find most recent by started_at
+        # Run files written before start times were embedded in the name
+        return self._get_last_legacy_job_run(
+            [runs_dir / name for name in names if name.endswith(".json")]
+        )
+
+    def _get_last_legacy_job_run(self, run_files: List[Path]) -> Optional[JobRun]:
+        """Find the most recent run by parsing `run_id`-named run files."""
         latest_run = None
         latest_time = None
 
-        for run_file in run_files[:20]:  # Check last 20 runs
+        for run_file in sorted(run_files, reverse=True)[:20]:  # Check last 20 runs
             data = self._read_json(run_file)
             if data:
                 run = JobRun.from_dict(data)
@@ -315,13 +995,56 @@ class LocalStateStore(StateStore):
 
         Returns True if successfully claimed, False if already claimed.
         """
-        current = self.get_filing(filing.cik, filing.accession_number)
-        if current and current.status != FilingStatus.DISCOVERED:
-            return False
-
-        filing.status = FilingStatus.DOWNLOADING
-        self.upsert_filing(filing)
-        return True
+        # The key lock makes check-and-set atomic between threads; the claim
+        # file does the same between processes
+        with self._key_lock(filing.key):
+            current = self.get_filing(filing.cik, filing.accession_number)
+            if current and current.status != FilingStatus.DISCOVERED:
+                return False
+
+            # link(2) fails with EEXIST if another worker holds the claim. The
+            # claim is released when the filing leaves DOWNLOADING.
+            claim_path = self._claim_path(filing.cik, filing.accession_number)
+            fd, tmp_path = create_temp_file(claim_path.parent, prefix=".claim.", suffix="")
+            try:
+                os.write(fd, f"{os.getpid()} {socket.gethostname()}\n".encode())
+                os.close(fd)
+                try:
+                    os.link(tmp_path, claim_path)
+                except FileExistsError:
+                    # The holder may have died between linking and finishing
+                    # the filing; take over its claim if so
+                    with self._claims_file_lock():
+                        if not self._claim_is_stale(claim_path):
+                            return False
+                        logger.warning(f"Taking over abandoned claim on {filing.key}")
+                        self._release_claim(filing.cik, filing.accession_number)
+                        os.link(tmp_path, claim_path)
+            except FileExistsError:
+                return False
+            finally:
+                os.unlink(tmp_path)
+
+            # Until the record says DOWNLOADING nothing else releases the
+            # claim, so any failure from here on must
+            previous_status = filing.status
+            try:
+                # Another process may have finished the filing (and released its
+                # claim) after our cached read; re-check the record on disk
+                path = self._filing_path_from_index(filing.cik, filing.accession_number)
+                data = self._read_json(path) if path else None
+                if data and data.get("status") != FilingStatus.DISCOVERED.value:
+                    self._release_claim(filing.cik, filing.accession_number)
+                    self._filing_cache.set(filing.key, Filing.from_dict(data))
+                    return False
+
+                filing.status = FilingStatus.DOWNLOADING
+                self.upsert_filing(filing)
+            except BaseException:
+                filing.status = previous_status
+                self._release_claim(filing.cik, filing.accession_number)
+                raise
+            return True
 
 
 class GCSStateStore(StateStore):
@@ -332,7 +1055,17 @@ class GCSStateStore(StateStore):
     Directory structure mirrors local: filings/{ticker}/{ticker}-{form_type}-{filed_date}.json
     """
 
-    def __init__(self, bucket_name: str, prefix: str = "sec-state"):
+    # One client per process: creating it resolves credentials, which is
+    # slow enough to matter for short CLI invocations
+    _shared_client = None
+    _client_lock = threading.Lock()
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "sec-state",
+        filing_cache_size: int = DEFAULT_FILING_CACHE_SIZE,
+    ):
         try:
             from google.cloud import storage
         except ImportError:
@@ -343,9 +1076,19 @@ class GCSStateStore(StateStore):
 
         self.bucket_name = bucket_name
         self.prefix = prefix.rstrip("/")
-        self.client = storage.Client()
+        with self._client_lock:
+            if GCSStateStore._shared_client is None:
+                GCSStateStore._shared_client = storage.Client()
+        self.client = GCSStateStore._shared_client
         self.bucket = self.client.bucket(bucket_name)
-        self._filing_cache: Dict[str, Filing] = {}
+        self._filing_cache = LRUCache(filing_cache_size)
+        self._key_locks = [threading.RLock() for _ in range(KEY_LOCK_SHARDS)]
+        self._index_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_index: Optional[Dict[str, Dict[str, str]]] = None
+        # Parsed index.json and the blob generation it was read at
+        self._index_cache: Optional[Dict[str, Dict[str, str]]] = None
+        self._index_generation: Optional[int] = None
 
     def _blob_path(self, *parts: str) -> str:
         """Build GCS blob path."""
@@ -353,10 +1096,11 @@ class GCSStateStore(StateStore):
 
     def _filing_basename(self, filing: Filing) -> str:
         """Generate base filename for a filing state."""
-        ticker = (filing.ticker or filing.cik).upper()
-        form_type = filing.form_type.replace("/", "-")
-        filed_date = filing.filed_at.strftime("%Y-%m-%d") if filing.filed_at else "unknown"
-        return f"{ticker}-{form_type}-{filed_date}"
+        return _filing_basename_for(
+            filing.ticker or filing.cik,
+            filing.form_type,
+            filing.filed_at.toordinal() if filing.filed_at else None,
+        )
 
     def _filing_blob_path(self, filing: Filing) -> str:
         """Build filing blob path from Filing object."""
@@ -366,21 +1110,84 @@ class GCSStateStore(StateStore):
 
     def _read_json(self, blob_path: str) -> Optional[Dict]:
         """Read JSON from GCS."""
+        from google.api_core.exceptions import NotFound
+
         blob = self.bucket.blob(blob_path)
-        if not blob.exists():
-            return None
         try:
-            content = blob.download_as_text()
-            return json.loads(content)
+            # One GET; a missing blob surfaces as NotFound rather than
+            # costing a separate exists() request first
+            return _json_loads(blob.download_as_bytes())
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(f"Error reading {blob_path}: {e}")
             return None
 
-    def _write_json(self, blob_path: str, data: Dict) -> None:
+    def _write_json(self, blob_path: str, data: Dict, pretty: bool = False) -> None:
         """Write JSON to GCS."""
         blob = self.bucket.blob(blob_path)
-        content = json.dumps(data, indent=2, default=str)
-        blob.upload_from_string(content, content_type="application/json")
+        blob.upload_from_string(_json_dumps(data, pretty), content_type="application/json")
+
+    def _load_filing_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load the filing index blob.
+
+        The parsed index is kept with the blob generation it came from; each
+        call fetches only the blob metadata and re-downloads the index when
+        the generation has changed.
+        """
+        if self._batch_index is not None:
+            return self._batch_index
+        index_path = self._blob_path("filings", "index.json")
+        with self._index_lock:
+            blob = self.bucket.get_blob(index_path)
+            if blob is None:
+                return {}
+            if self._index_cache is not None and blob.generation == self._index_generation:
+                return self._index_cache
+            try:
+                index = _json_loads(blob.download_as_bytes(if_generation_match=blob.generation))
+            except Exception as e:
+                # Replaced between the metadata and media requests
+                logger.debug(f"Filing index changed while downloading, re-reading: {e}")
+                return self._read_json(index_path) or {}
+            self._index_cache, self._index_generation = index, blob.generation
+            return index
+
+    def _save_filing_index(self, index: Dict[str, Dict[str, str]]) -> None:
+        """Save the filing index blob (deferred while a batch is open)."""
+        if self._batch_depth:
+            self._batch_index = index
+            return
+        self._write_filing_index(index)
+
+    def _write_filing_index(self, index: Dict[str, Dict[str, str]]) -> None:
+        """Upload the filing index and remember the generation it created."""
+        blob = self.bucket.blob(self._blob_path("filings", "index.json"))
+        with self._index_lock:
+            try:
+                blob.upload_from_string(_json_dumps(index), content_type="application/json")
+            except Exception:
+                self._index_cache = self._index_generation = None
+                raise
+            self._index_cache, self._index_generation = index, blob.generation
+
+    def begin_batch(self) -> None:
+        """Start deferring index uploads; the index is held in memory."""
+        with self._index_lock:
+            if self._batch_depth == 0:
+                self._batch_index = self._load_filing_index()
+            self._batch_depth += 1
+
+    def commit_batch(self) -> None:
+        """Upload the batched index once."""
+        with self._index_lock:
+            if self._batch_depth == 0:
+                return
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                index, self._batch_index = self._batch_index, None
+                self._write_filing_index(index)
 
     def load_watchlist(self) -> Watchlist:
         """Load the company watchlist."""
@@ -391,37 +1198,63 @@ class GCSStateStore(StateStore):
 
     def save_watchlist(self, watchlist: Watchlist) -> None:
         """Save the company watchlist."""
-        self._write_json(self._blob_path("watchlist.json"), watchlist.to_dict())
+        self._write_json(self._blob_path("watchlist.json"), watchlist.to_dict(), pretty=True)
 
     def get_filing(self, cik: str, accession_number: str) -> Optional[Filing]:
         """Get a filing by its unique key."""
+        # Check the cache before touching the index; loading it costs a GCS
+        # round trip even when the index itself is unchanged
+        filing = self._filing_cache.get(f"{cik}:{accession_number}")
+        if filing is not None:
+            return filing
+        return self._get_filing(cik, accession_number, self._load_filing_index())
+
+    def _get_filing(
+        self,
+        cik: str,
+        accession_number: str,
+        index: Dict[str, Dict[str, str]],
+        populate: bool = True,
+    ) -> Optional[Filing]:
+        """Get a filing through the LRU cache (see LocalStateStore._get_filing)."""
         key = f"{cik}:{accession_number}"
-        if key in self._filing_cache:
-            return self._filing_cache[key]
+        filing = self._filing_cache.get(key) if populate else self._filing_cache.peek(key)
+        if filing is not None:
+            return filing
 
         # Look up path from index
-        index = self._read_json(self._blob_path("filings", "index.json")) or {}
         if key in index and "file_path" in index[key]:
             blob_path = self._blob_path("filings", index[key]["file_path"])
             data = self._read_json(blob_path)
             if data:
                 filing = Filing.from_dict(data)
-                self._filing_cache[key] = filing
+                if populate:
+                    self._filing_cache.set(key, filing)
                 return filing
         return None
 
     def upsert_filing(self, filing: Filing) -> None:
         """Insert or update a filing."""
-        blob_path = self._filing_blob_path(filing)
-        self._write_json(blob_path, filing.to_dict())
+        key = filing.key
+        # Per-key lock, as in LocalStateStore.upsert_filing
+        with self._key_lock(key):
+            blob_path = self._filing_blob_path(filing)
+            self._write_json(blob_path, filing.to_dict())
 
-        # Get relative path for index storage (remove prefix)
-        relative_path = blob_path.replace(f"{self.prefix}/filings/", "")
+            # Get relative path for index storage (remove prefix)
+            relative_path = blob_path.replace(f"{self.prefix}/filings/", "")
 
-        # Update index with file_path for lookup
-        index = self._read_json(self._blob_path("filings", "index.json")) or {}
-        key = filing.key
-        index[key] = {
+            # Update index with file_path for lookup
+            with self._index_lock:
+                index = self._load_filing_index()
+                index[key] = self._index_entry(filing, relative_path)
+                self._save_filing_index(index)
+
+            self._filing_cache.set(key, filing)
+
+    @staticmethod
+    def _index_entry(filing: Filing, relative_path: str) -> Dict[str, Any]:
+        return {
             "cik": filing.cik,
             "accession": filing.accession_number,
             "ticker": filing.ticker,
@@ -430,55 +1263,105 @@ class GCSStateStore(StateStore):
             "filed_at": filing.filed_at.isoformat() if filing.filed_at else None,
             "file_path": relative_path,  # Store path for lookup
         }
-        self._write_json(self._blob_path("filings", "index.json"), index)
 
-        self._filing_cache[filing.key] = filing
+    def upsert_filings_bulk(self, filings: List[Filing]) -> None:
+        """
+        Insert or update several filings.
+
+        The filing blobs are uploaded concurrently and the index is then
+        uploaded once, instead of two sequential uploads per filing.
+        """
+        if len(filings) <= PARALLEL_READ_MIN:
+            super().upsert_filings_bulk(filings)
+            return
+
+        def upload(filing: Filing) -> str:
+            blob_path = self._filing_blob_path(filing)
+            self._write_json(blob_path, filing.to_dict())
+            return blob_path.replace(f"{self.prefix}/filings/", "")
+
+        with ThreadPoolExecutor(max_workers=GCS_IO_WORKERS) as executor:
+            relative_paths = list(executor.map(upload, filings))
+
+        with self._index_lock:
+            index = self._load_filing_index()
+            for filing, relative_path in zip(filings, relative_paths):
+                index[filing.key] = self._index_entry(filing, relative_path)
+            self._save_filing_index(index)
+
+        for filing in filings:
+            self._filing_cache.set(filing.key, filing)
+
+    def _get_filings(
+        self, infos: List[Dict[str, str]], index: Dict[str, Dict[str, str]]
+    ) -> List[Filing]:
+        """Download many filings concurrently, in order, skipping missing ones."""
+        def read(info: Dict[str, str]) -> Optional[Filing]:
+            return self._get_filing(info["cik"], info["accession"], index, populate=False)
+
+        if len(infos) <= PARALLEL_READ_MIN:
+            results = map(read, infos)
+        else:
+            with ThreadPoolExecutor(max_workers=GCS_IO_WORKERS) as executor:
+                results = list(executor.map(read, infos))
+        return [filing for filing in results if filing]
 
     def get_filings_by_status(self, status: FilingStatus) -> List[Filing]:
         """Get all filings with a specific status."""
-        index = self._read_json(self._blob_path("filings", "index.json")) or {}
-        filings = []
-
-        for key, info in index.items():
-            if info.get("status") == status.value:
-                filing = self.get_filing(info["cik"], info["accession"])
-                if filing:
-                    filings.append(filing)
-
-        return filings
+        index = self._load_filing_index()
+        infos = [info for info in list(index.values()) if info.get("status") == status.value]
+        return self._get_filings(infos, index)
 
     def get_filings_for_company(self, cik: str) -> List[Filing]:
         """Get all filings for a company."""
-        index = self._read_json(self._blob_path("filings", "index.json")) or {}
-        filings = []
+        index = self._load_filing_index()
+        infos = [info for info in list(index.values()) if info.get("cik") == cik]
+        return self._get_filings(infos, index)
 
-        for key, info in index.items():
-            if info.get("cik") == cik:
-                filing = self.get_filing(cik, info["accession"])
-                if filing:
-                    filings.append(filing)
+    def count_filings_by_status(self) -> Dict[str, int]:
+        """Count filings per status value from the index alone."""
+        index = self._load_filing_index()
+        return dict(Counter(info.get("status") for info in list(index.values())))
 
-        return filings
+    def known_accessions(self, cik: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """Get (cik, accession_number) for every filing in state, optionally for one company."""
+        index = self._load_filing_index()
+        return {
+            (info["cik"], info["accession"])
+            for info in list(index.values())
+            if cik is None or info.get("cik") == cik
+        }
 
     def save_job_run(self, run: JobRun) -> None:
         """Save a job run record."""
-        self._write_json(self._blob_path("runs", f"{run.run_id}.json"), run.to_dict())
+        self._write_json(self._blob_path("runs", _run_filename(run)), run.to_dict())
 
     def get_last_job_run(self) -> Optional[JobRun]:
-        """Get the most recent job run."""
+        """
+        Get the most recent job run.
+
+        Blob listings are lexical and run blobs are named by start time, so
+        only the newest blob is downloaded.
+        """
         prefix = self._blob_path("runs") + "/"
-        blobs = list(self.bucket.list_blobs(prefix=prefix, max_results=50))
+        names = [
+            blob.name for blob in self.bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
+        ]
+        timestamped = [name for name in names if _is_timestamped_run(name[len(prefix):])]
 
-        if not blobs:
-            return None
+        for name in sorted(timestamped, reverse=True):
+            data = self._read_json(name)
+            if data:
+                return JobRun.from_dict(data)
 
+        # Run blobs written before start times were embedded in the name
         latest_run = None
         latest_time = None
 
-        for blob in blobs:
-            if not blob.name.endswith(".json"):
+        for name in names:
+            if not name.endswith(".json"):
                 continue
-            data = self._read_json(blob.name.replace(f"{self.bucket_name}/", ""))
+            data = self._read_json(name)
             if data:
                 run = JobRun.from_dict(data)
                 if latest_time is None or run.started_at > latest_time:
@@ -497,15 +1380,26 @@ def create_state_store(config: Dict[str, Any]) -> StateStore:
         state_dir: Path for local storage
         gcs_bucket: Bucket name for GCS
         gcs_prefix: Prefix within bucket
+        durability: "normal" (default) or "full" to fsync local writes
+        filing_cache_size: Filing records kept in memory (LRU)
+        state_format: "json" (default) or "msgpack" for local filing records
+        claim_timeout_sec: Age after which a local claim is taken over
     """
     storage_type = config.get("storage_type", "local")
+    cache_size = config.get("filing_cache_size", DEFAULT_FILING_CACHE_SIZE)
 
     if storage_type == "gcs":
         bucket = config.get("gcs_bucket")
         if not bucket:
             raise ValueError("gcs_bucket is required for GCS storage")
         prefix = config.get("gcs_prefix", "sec-state")
-        return GCSStateStore(bucket, prefix)
+        return GCSStateStore(bucket, prefix, filing_cache_size=cache_size)
     else:
         state_dir = config.get("state_dir", "./state")
-        return LocalStateStore(state_dir)
+        return LocalStateStore(
+            state_dir,
+            durability=config.get("durability", "normal"),
+            filing_cache_size=cache_size,
+            state_format=config.get("state_format", "json"),
+            claim_timeout=config.get("claim_timeout_sec", DEFAULT_CLAIM_TIMEOUT),
+        )
@@ -20,31 +20,201 @@ data_dir/
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import shutil
+import tempfile
+import threading
+import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Dict, Any, BinaryIO, Union
+from typing import Optional, Dict, Any, BinaryIO, Callable, List, Tuple, Union
+from uuid import UUID
 
 from models import Filing
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for streamed JSON artifacts; json.dump emits many small
+# chunks, which this coalesces into few write(2) calls
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+
+# Local HTML at least this large is decoded straight from an mmap of the file,
+# skipping the intermediate bytes copy
+MMAP_LOAD_MIN_BYTES = 256 * 1024
+
+# GCS uploads at least this large are split into parts uploaded in parallel
+# and composed into the final object (0 disables)
+DEFAULT_PARALLEL_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+PARALLEL_UPLOAD_PART_SIZE = 32 * 1024 * 1024
+PARALLEL_UPLOAD_WORKERS = 8
+GCS_MAX_COMPOSE_SOURCES = 32
+
+# Resumable GCS uploads (anything over the client's 8 MiB multipart limit)
+# send the body in chunks of upload_chunk_size, which must be a multiple of
+# 256 KiB; None keeps the client library's default
+GCS_CHUNK_SIZE_MULTIPLE = 256 * 1024
+
+# With dedup_artifacts, local HTML/PDF bodies are stored once under
+# data_dir/.objects/{sha256[:2]}/{sha256} and hardlinked into ticker dirs
+# (share classes such as GOOG/GOOGL file identical documents); recently
+# stored digests are remembered so repeats skip the exists() check
+OBJECTS_DIR_NAME = ".objects"
+DEDUP_DIGEST_CACHE_SIZE = 4096
+DEDUP_HASH_BLOCK_SIZE = 1 << 20
+
+# With use_odirect, local PDFs at least this large are written with O_DIRECT,
+# bypassing the page cache (the alignment unit covers 512/4096-byte sectors)
+ODIRECT_MIN_BYTES = 64 * 1024 * 1024
+ODIRECT_ALIGNMENT = mmap.PAGESIZE
+
+# compress_html stores HTML as zstd ({basename}.html.zst); SEC markup
+# compresses roughly 10x at the default level
+ZSTD_LEVEL = 3
+ZSTD_SUFFIX = ".zst"
+
+# Concurrent uploads in GCSStorage.save_many
+SAVE_MANY_WORKERS = 16
+
+# GCS JSON uploads are spooled in memory up to this size, then to disk
+JSON_SPOOL_MAX_SIZE = 8 << 20
+
+
+# Conversions for values JSON has no type for. datetime precedes date for
+# the isinstance fallback (datetime is a date subclass); isoformat matches
+# what orjson emits natively, so both serializers write the same text
+_JSON_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+    UUID: str,
+    Path: str,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """`default` hook for json/orjson; unknown types raise instead of being str()'d."""
+    encoder = _JSON_ENCODERS.get(type(obj))
+    if encoder is None:
+        for cls, candidate in _JSON_ENCODERS.items():
+            if isinstance(obj, cls):
+                encoder = candidate
+                break
+        else:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return encoder(obj)
+
+
+def _dump_json(data: Dict, f, pretty: bool) -> None:
+    """Stream JSON into a text file: compact by default, indented when `pretty`."""
+    if pretty:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        json.dump(data, f, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+
+@functools.lru_cache(maxsize=4096)
+def _filing_basename_for(ticker: str, form_type: str, filed_ordinal: int) -> str:
+    """
+    Build `{TICKER}-{FORM_TYPE}-{FILED_DATE}` (memoized; shared by both backends).
+
+    Every artifact of a filing (JSON, HTML, PDF, derivatives) asks for the
+    same basename, so the string work happens once per filing.
+    """
+    d = date.fromordinal(filed_ordinal)
+    return f"{ticker.upper()}-{form_type.replace('/', '-')}-{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _zstd_compress(content: bytes) -> bytes:
+    # Compressor objects are not thread-safe; they are cheap to create
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+
+
+def _zstd_decompress(content: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(content)
+
+
+def _html_compression_enabled(compress_html: bool) -> bool:
+    if compress_html and not HAS_ZSTD:
+        logger.warning("zstandard not installed, storing HTML uncompressed")
+        return False
+    return compress_html
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DEDUP_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def create_temp_file(directory: Union[str, Path], prefix: str = "", suffix: str = ".tmp") -> Tuple[int, str]:
+    """
+    Create and open a uniquely named file for an atomic write-then-rename.
+
+    Unlike tempfile.mkstemp (always 0600), the file is created 0666 and the
+    kernel applies the umask, so the renamed file gets the mode a plain
+    open() would have given it.
+
+    Returns:
+        (fd, path) with fd open for writing
+    """
+    while True:
+        path = os.path.join(directory, f"{prefix}{uuid.uuid4().hex[:12]}{suffix}")
+        try:
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def _serialize_json(data: Dict, pretty: bool) -> bytes:
+    """Serialize JSON to UTF-8 bytes with orjson (callers check HAS_ORJSON)."""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+def _deserialize_json(content: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class FileStorage(ABC):
     """Abstract base class for file storage."""
 
     @abstractmethod
-    def save_json(self, filing: Filing, data: Dict) -> str:
+    def save_json(self, filing: Filing, data: Dict, pretty: bool = False) -> str:
         """
         Save JSON data for a filing.
 
         Args:
             filing: Filing metadata
             data: JSON data to save
+            pretty: Indent the output for reading (default is compact)
 
         Returns:
             Relative path where data was saved
@@ -79,6 +249,41 @@ class FileStorage(ABC):
         """
         pass
 
+    def save_pdf_from_path(self, filing: Filing, local_path: str | Path) -> str:
+        """
+        Save a PDF that is already on local disk.
+
+        Backends override this to copy or stream the file without reading it
+        into memory; the file itself is left in place.
+
+        Returns:
+            Relative path where content was saved
+        """
+        return self.save_pdf(filing, Path(local_path).read_bytes())
+
+    def save_many(self, items: List[Tuple[Filing, str, Any]]) -> List[str]:
+        """
+        Save several artifacts in one call.
+
+        Args:
+            items: (filing, kind, content) tuples; kind is "json", "html" or
+                "pdf" and content is what the matching save_* method takes
+
+        Returns:
+            Relative paths, in the order of `items`
+        """
+        return [self._save_one(item) for item in items]
+
+    def _save_one(self, item: Tuple[Filing, str, Any]) -> str:
+        filing, kind, content = item
+        if kind == "json":
+            return self.save_json(filing, content)
+        if kind == "html":
+            return self.save_html(filing, content)
+        if kind == "pdf":
+            return self.save_pdf(filing, content)
+        raise ValueError(f"Unknown artifact kind: {kind}")
+
     @abstractmethod
     def load_json(self, path: str) -> Optional[Dict]:
         """Load JSON from path."""
@@ -118,15 +323,50 @@ class FileStorage(ABC):
 class LocalStorage(FileStorage):
     """Local filesystem storage."""
 
-    def __init__(self, data_dir: str | Path):
+    def __init__(
+        self,
+        data_dir: str | Path,
+        use_odirect: bool = False,
+        compress_html: bool = False,
+        dedup_artifacts: bool = False,
+    ):
+        """
+        Initialize local storage.
+
+        Args:
+            data_dir: Root directory for artifacts
+            use_odirect: Write PDFs of ODIRECT_MIN_BYTES or more with O_DIRECT
+                so huge renders do not evict the page cache (falls back to a
+                normal write where the filesystem refuses O_DIRECT)
+            compress_html: Store HTML zstd-compressed as .html.zst (needs the
+                zstandard package); plain .html files stay readable
+            dedup_artifacts: Store each distinct HTML/PDF body once and
+                hardlink it into place (falls back to a plain write where
+                hardlinks are unsupported)
+        """
         self.data_dir = Path(data_dir)
+        self.use_odirect = use_odirect and hasattr(os, "O_DIRECT")
+        self.compress_html = _html_compression_enabled(compress_html)
+        self.dedup_artifacts = dedup_artifacts
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        # Ticker directories already created (skips a Path build and mkdir
+        # for every artifact saved)
+        self._ticker_dirs: Dict[str, Path] = {}
+        self._objects_dir = self.data_dir / OBJECTS_DIR_NAME
+        # Files may be hardlinked to shared objects (also after dedup is
+        # turned off again); those must be replaced, never written in place
+        self._may_have_links = dedup_artifacts or self._objects_dir.exists()
+        self._recent_digests: OrderedDict[str, None] = OrderedDict()
+        self._digest_lock = threading.Lock()
 
     def _ticker_dir(self, filing: Filing) -> Path:
         """Get directory for a ticker (e.g., data/AAPL/)."""
         ticker = (filing.ticker or filing.cik).upper()
-        dir_path = self.data_dir / ticker
-        dir_path.mkdir(parents=True, exist_ok=True)
+        dir_path = self._ticker_dirs.get(ticker)
+        if dir_path is None:
+            dir_path = self.data_dir / ticker
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ticker_dirs[ticker] = dir_path
         return dir_path
 
     def _filing_basename(self, filing: Filing) -> str:
@@ -136,23 +376,27 @@ class LocalStorage(FileStorage):
         Format: {TICKER}-{FORM_TYPE}-{FILED_DATE}
         Example: AAPL-10-K-2025-10-31
         """
-        ticker = (filing.ticker or filing.cik).upper()
-        form_type = filing.form_type.replace("/", "-")  # Handle 10-K/A etc.
-        filed_date = filing.filed_at.strftime("%Y-%m-%d")
-        return f"{ticker}-{form_type}-{filed_date}"
+        # form_type "/" becomes "-" (10-K/A etc.)
+        return _filing_basename_for(
+            filing.ticker or filing.cik, filing.form_type, filing.filed_at.toordinal()
+        )
 
     def _resolve_path(self, path: str) -> Path:
         """Resolve relative path to absolute."""
         return self.data_dir / path
 
-    def save_json(self, filing: Filing, data: Dict) -> str:
-        """Save JSON data for a filing."""
+    def save_json(self, filing: Filing, data: Dict, pretty: bool = False) -> str:
+        """Save JSON data for a filing (orjson, else streamed through a 1 MiB buffer)."""
         dir_path = self._ticker_dir(filing)
         basename = self._filing_basename(filing)
         file_path = dir_path / f"{basename}.json"
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        if HAS_ORJSON:
+            # orjson emits the UTF-8 bytes directly, faster than streaming
+            file_path.write_bytes(_serialize_json(data, pretty))
+        else:
+            with open(file_path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER_SIZE) as f:
+                _dump_json(data, f, pretty)
 
         relative_path = str(file_path.relative_to(self.data_dir))
         logger.debug(f"Saved JSON to {relative_path}")
@@ -162,10 +406,16 @@ class LocalStorage(FileStorage):
         """Save HTML content for a filing."""
         dir_path = self._ticker_dir(filing)
         basename = self._filing_basename(filing)
-        file_path = dir_path / f"{basename}.html"
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if self.compress_html:
+            file_path = dir_path / f"{basename}.html{ZSTD_SUFFIX}"
+            self._write_artifact(file_path, _zstd_compress(content.encode("utf-8")))
+        elif self.dedup_artifacts:
+            file_path = dir_path / f"{basename}.html"
+            self._write_artifact(file_path, content.encode("utf-8"))
+        else:
+            file_path = dir_path / f"{basename}.html"
+            self._unshare(file_path)
+            file_path.write_text(content, encoding="utf-8")
 
         relative_path = str(file_path.relative_to(self.data_dir))
         logger.debug(f"Saved HTML to {relative_path} ({len(content):,} chars)")
@@ -177,33 +427,179 @@ class LocalStorage(FileStorage):
         basename = self._filing_basename(filing)
         file_path = dir_path / f"{basename}.pdf"
 
-        with open(file_path, "wb") as f:
-            f.write(content)
+        if self.dedup_artifacts:
+            self._write_artifact(file_path, content)
+        else:
+            self._unshare(file_path)
+            if not (
+                self.use_odirect
+                and len(content) >= ODIRECT_MIN_BYTES
+                and self._odirect_write(file_path, content)
+            ):
+                file_path.write_bytes(content)
 
         relative_path = str(file_path.relative_to(self.data_dir))
         logger.debug(f"Saved PDF to {relative_path} ({len(content):,} bytes)")
         return relative_path
 
+    def _write_artifact(self, file_path: Path, content: bytes) -> None:
+        """Write content to file_path, via the object store when deduplicating."""
+        if not (self.dedup_artifacts and self._link_object(file_path, content)):
+            self._unshare(file_path)
+            file_path.write_bytes(content)
+
+    def _unshare(self, file_path: Path) -> None:
+        """Unlink file_path if it is a hardlink, so writing it cannot alter shared copies."""
+        if not self._may_have_links:
+            return
+        try:
+            if file_path.stat().st_nlink > 1:
+                file_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _link_object(
+        self,
+        file_path: Path,
+        content: Optional[bytes] = None,
+        source_path: Optional[Path] = None,
+    ) -> bool:
+        """
+        Store content under its SHA-256 in the object store (unless already
+        there) and hardlink it to file_path.
+
+        Args:
+            file_path: Artifact path to link
+            content: Body to store, or
+            source_path: File holding the body (hashed and copied in blocks)
+
+        Returns:
+            False if the object could not be linked (e.g. hardlinks are not
+            supported), in which case the caller writes the file itself
+        """
+        if source_path is not None:
+            digest = _file_sha256(source_path)
+        else:
+            digest = hashlib.sha256(content).hexdigest()
+        object_path = self._objects_dir / digest[:2] / digest
+        with self._digest_lock:
+            known = digest in self._recent_digests
+            if known:
+                self._recent_digests.move_to_end(digest)
+        try:
+            if not (known or object_path.exists()):
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = create_temp_file(object_path.parent, prefix=f"{digest}.")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        if source_path is not None:
+                            with open(source_path, "rb") as src:
+                                shutil.copyfileobj(src, f, DEDUP_HASH_BLOCK_SIZE)
+                        else:
+                            f.write(content)
+                    # Concurrent writers of one digest store identical bytes
+                    os.replace(tmp_name, object_path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+            # Linked beside the target and renamed over it, so a previous file
+            # (or another object's link) is replaced rather than written into
+            link_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.link")
+            os.link(object_path, link_path)
+            try:
+                os.replace(link_path, file_path)
+            finally:
+                # rename() is a no-op when both names are already the same inode
+                try:
+                    os.unlink(link_path)
+                except FileNotFoundError:
+                    pass
+        except OSError as e:
+            logger.debug(f"Dedup link failed for {file_path.name}, writing directly: {e}")
+            with self._digest_lock:
+                self._recent_digests.pop(digest, None)
+            return False
+
+        with self._digest_lock:
+            self._recent_digests[digest] = None
+            if len(self._recent_digests) > DEDUP_DIGEST_CACHE_SIZE:
+                self._recent_digests.popitem(last=False)
+        return True
+
+    @staticmethod
+    def _odirect_write(file_path: Path, content: bytes) -> bool:
+        """
+        Write content with O_DIRECT from a page-aligned buffer.
+
+        O_DIRECT needs aligned buffers, offsets and lengths, so the padded
+        buffer is written and the file truncated back to the real size.
+
+        Returns:
+            False if the filesystem rejects O_DIRECT (e.g. tmpfs), in which
+            case nothing useful was written and the caller should fall back
+        """
+        aligned_len = -(-len(content) // ODIRECT_ALIGNMENT) * ODIRECT_ALIGNMENT
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        except OSError as e:
+            logger.debug(f"O_DIRECT unavailable for {file_path}: {e}")
+            return False
+        try:
+            # Anonymous mmaps are page-aligned
+            with mmap.mmap(-1, aligned_len) as buf:
+                buf.write(content)
+                written = 0
+                while written < aligned_len:
+                    written += os.pwrite(fd, memoryview(buf)[written:], written)
+            os.ftruncate(fd, len(content))
+            return True
+        except OSError as e:
+            logger.debug(f"O_DIRECT write failed for {file_path}: {e}")
+            return False
+        finally:
+            os.close(fd)
+
+    def save_pdf_from_path(self, filing: Filing, local_path: str | Path) -> str:
+        """Copy a PDF file into storage (kernel-side copy; no Python buffer)."""
+        dir_path = self._ticker_dir(filing)
+        basename = self._filing_basename(filing)
+        file_path = dir_path / f"{basename}.pdf"
+
+        if not (self.dedup_artifacts and self._link_object(file_path, source_path=Path(local_path))):
+            self._unshare(file_path)
+            shutil.copyfile(local_path, file_path)
+
+        relative_path = str(file_path.relative_to(self.data_dir))
+        logger.debug(f"Saved PDF to {relative_path} ({file_path.stat().st_size:,} bytes)")
+        return relative_path
+
     def load_json(self, path: str) -> Optional[Dict]:
         """Load JSON from path."""
         full_path = self._resolve_path(path)
         if not full_path.exists():
             return None
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _deserialize_json(full_path.read_bytes())
         except Exception as e:
             logger.error(f"Error loading JSON from {path}: {e}")
             return None
 
     def load_html(self, path: str) -> Optional[str]:
-        """Load HTML from path."""
+        """Load HTML from path (.html, or zstd-compressed .html.zst)."""
         full_path = self._resolve_path(path)
         if not full_path.exists():
-            return None
+            # Stored compressed after the path was recorded
+            compressed_path = full_path.with_name(full_path.name + ZSTD_SUFFIX)
+            if not (HAS_ZSTD and compressed_path.exists()):
+                return None
+            full_path = compressed_path
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                return f.read()
+            if full_path.name.endswith(ZSTD_SUFFIX):
+                return _zstd_decompress(full_path.read_bytes()).decode("utf-8")
+            if full_path.stat().st_size >= MMAP_LOAD_MIN_BYTES:
+                with self.open_mmap(path) as mm:
+                    return str(mm, "utf-8")
+            return full_path.read_text(encoding="utf-8")
         except Exception as e:
             logger.error(f"Error loading HTML from {path}: {e}")
             return None
@@ -214,12 +610,29 @@ class LocalStorage(FileStorage):
         if not full_path.exists():
             return None
         try:
-            with open(full_path, "rb") as f:
-                return f.read()
+            return full_path.read_bytes()
         except Exception as e:
             logger.error(f"Error loading PDF from {path}: {e}")
             return None
 
+    def open_mmap(self, path: str) -> Optional[mmap.mmap]:
+        """
+        Map a stored file read-only, for large PDFs/HTML that consumers can
+        slice or scan without copying the whole file into memory.
+
+        The mapping is bytes-like and a context manager; close it when done.
+        Returns None if the file does not exist or is empty (which cannot be
+        mapped).
+        """
+        try:
+            with open(self._resolve_path(path), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                # The mapping stays valid after the file is closed
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
     def exists(self, path: str) -> bool:
         """Check if file exists."""
         return self._resolve_path(path).exists()
@@ -242,14 +655,19 @@ class LocalStorage(FileStorage):
 
     def get_filing_size(self, filing: Filing) -> Dict[str, int]:
         """Get sizes of all files for a filing."""
-        dir_path = self._ticker_dir(filing)
-        basename = self._filing_basename(filing)
+        prefix = self._filing_basename(filing) + "."
         sizes = {}
 
-        for ext in ["json", "html", "pdf"]:
-            file_path = dir_path / f"{basename}.{ext}"
-            if file_path.exists():
-                sizes[f"{basename}.{ext}"] = file_path.stat().st_size
+        # One directory sweep; DirEntry.stat() reuses what scandir read
+        with os.scandir(self._ticker_dir(filing)) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.startswith(prefix)
+                    and name[len(prefix):] in ("json", "html", "html.zst", "pdf")
+                    and entry.is_file()
+                ):
+                    sizes[name] = entry.stat().st_size
 
         return sizes
 
@@ -257,7 +675,26 @@ class LocalStorage(FileStorage):
 class GCSStorage(FileStorage):
     """Google Cloud Storage backend."""
 
-    def __init__(self, bucket_name: str, prefix: str = "sec-data"):
+    # One client per process: creating it resolves credentials, which is
+    # slow enough to matter for short CLI invocations
+    _shared_client = None
+    _client_lock = threading.Lock()
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "sec-data",
+        parallel_upload_threshold: int = DEFAULT_PARALLEL_UPLOAD_THRESHOLD,
+        compress_html: bool = False,
+        upload_chunk_size: Optional[int] = None,
+    ):
+        if upload_chunk_size is not None and (
+            upload_chunk_size <= 0 or upload_chunk_size % GCS_CHUNK_SIZE_MULTIPLE
+        ):
+            raise ValueError(
+                f"upload_chunk_size must be a positive multiple of "
+                f"{GCS_CHUNK_SIZE_MULTIPLE} bytes, got {upload_chunk_size}"
+            )
         try:
             from google.cloud import storage
         except ImportError:
@@ -268,8 +705,18 @@ class GCSStorage(FileStorage):
 
         self.bucket_name = bucket_name
         self.prefix = prefix.rstrip("/")
-        self.client = storage.Client()
+        with self._client_lock:
+            if GCSStorage._shared_client is None:
+                GCSStorage._shared_client = storage.Client()
+        self.client = GCSStorage._shared_client
         self.bucket = self.client.bucket(bucket_name)
+        self.parallel_upload_threshold = parallel_upload_threshold
+        self.compress_html = _html_compression_enabled(compress_html)
+        self.upload_chunk_size = upload_chunk_size
+
+    def _upload_blob(self, blob_path: str):
+        """Blob handle for an upload, using the configured resumable chunk size."""
+        return self.bucket.blob(blob_path, chunk_size=self.upload_chunk_size)
 
     def _filing_basename(self, filing: Filing) -> str:
         """
@@ -278,10 +725,9 @@ class GCSStorage(FileStorage):
         Format: {TICKER}-{FORM_TYPE}-{FILED_DATE}
         Example: AAPL-10-K-2025-10-31
         """
-        ticker = (filing.ticker or filing.cik).upper()
-        form_type = filing.form_type.replace("/", "-")
-        filed_date = filing.filed_at.strftime("%Y-%m-%d")
-        return f"{ticker}-{form_type}-{filed_date}"
+        return _filing_basename_for(
+            filing.ticker or filing.cik, filing.form_type, filing.filed_at.toordinal()
+        )
 
     def _blob_path(self, filing: Filing, ext: str) -> str:
         """Build GCS blob path for a filing."""
@@ -295,24 +741,116 @@ class GCSStorage(FileStorage):
             return path
         return f"{self.prefix}/{path}"
 
-    def save_json(self, filing: Filing, data: Dict) -> str:
-        """Save JSON data for a filing."""
+    def save_json(self, filing: Filing, data: Dict, pretty: bool = False) -> str:
+        """
+        Save JSON data for a filing.
+
+        With orjson the payload is serialized to bytes in one call. Otherwise
+        the JSON is streamed into a spooled temp file and uploaded from there,
+        so the whole serialized string is never built next to the dict.
+        """
         blob_path = self._blob_path(filing, "json")
-        blob = self.bucket.blob(blob_path)
 
-        content = json.dumps(data, indent=2, default=str)
-        blob.upload_from_string(content, content_type="application/json")
+        if HAS_ORJSON:
+            self._upload_bytes(blob_path, _serialize_json(data, pretty), "application/json")
+        else:
+            self._upload_streamed_json(self._upload_blob(blob_path), data, pretty)
 
         relative_path = blob_path.replace(f"{self.prefix}/", "")
         logger.debug(f"Saved JSON to gs://{self.bucket_name}/{blob_path}")
         return relative_path
 
+    @staticmethod
+    def _upload_streamed_json(blob, data: Dict, pretty: bool) -> None:
+        """Stream JSON through a spooled temp file into the blob (no orjson)."""
+        with tempfile.SpooledTemporaryFile(max_size=JSON_SPOOL_MAX_SIZE) as spool:
+            text = io.TextIOWrapper(spool, encoding="utf-8", write_through=True)
+            _dump_json(data, text, pretty)
+            text.flush()
+            text.detach()  # the spool is closed by the with block, not the wrapper
+            blob.upload_from_file(spool, rewind=True, content_type="application/json")
+
+    def _upload_bytes(self, blob_path: str, content: bytes, content_type: str) -> None:
+        """Upload content, in parallel composed parts when it is large."""
+        threshold = self.parallel_upload_threshold
+        if not threshold or len(content) < threshold:
+            self._upload_blob(blob_path).upload_from_string(content, content_type=content_type)
+            return
+        self._parallel_upload(blob_path, content, content_type)
+
+    def _parallel_upload(self, blob_path: str, content: bytes, content_type: str) -> None:
+        """
+        Upload parts of `content` concurrently, then compose them into
+        `blob_path`. A single upload stream is limited to one connection's
+        throughput; several parts in flight are not.
+
+        compose() accepts at most GCS_MAX_COMPOSE_SOURCES sources, so parts
+        beyond that are first composed in batches into intermediate objects
+        (repeatedly, for very large payloads) and those into the final object.
+        Part size stays fixed, so multi-GB payloads keep all workers busy.
+        """
+        view = memoryview(content)
+        part_size = PARALLEL_UPLOAD_PART_SIZE
+        part_prefix = f"{blob_path}.tmp.{uuid.uuid4().hex[:8]}"
+        parts = [
+            (self._upload_blob(f"{part_prefix}.{i}"), view[offset:offset + part_size])
+            for i, offset in enumerate(range(0, len(content), part_size))
+        ]
+        temporaries = [blob for blob, _ in parts]
+
+        def upload(part) -> None:
+            blob, chunk = part
+            blob.upload_from_string(bytes(chunk), content_type=content_type)
+
+        def compose(batch) -> None:
+            blob, sources = batch
+            blob.content_type = content_type
+            blob.compose(sources)
+
+        try:
+            with ThreadPoolExecutor(max_workers=PARALLEL_UPLOAD_WORKERS) as executor:
+                list(executor.map(upload, parts))
+
+                sources = [blob for blob, _ in parts]
+                level = 0
+                while len(sources) > GCS_MAX_COMPOSE_SOURCES:
+                    step = GCS_MAX_COMPOSE_SOURCES
+                    batches = [
+                        (self.bucket.blob(f"{part_prefix}.c{level}.{i}"), sources[j:j + step])
+                        for i, j in enumerate(range(0, len(sources), step))
+                    ]
+                    temporaries.extend(blob for blob, _ in batches)
+                    list(executor.map(compose, batches))
+                    sources = [blob for blob, _ in batches]
+                    level += 1
+
+            compose((self.bucket.blob(blob_path), sources))
+        finally:
+            try:
+                self.bucket.delete_blobs(temporaries, on_error=lambda blob: None)
+            except Exception as e:
+                logger.warning(f"Failed to delete upload parts for {blob_path}: {e}")
+        logger.debug(f"Uploaded {blob_path} in {len(parts)} parallel parts")
+
+    def save_many(self, items: List[Tuple[Filing, str, Any]]) -> List[str]:
+        """Save several artifacts with their uploads in flight concurrently."""
+        if len(items) <= 1:
+            return super().save_many(items)
+        with ThreadPoolExecutor(max_workers=min(SAVE_MANY_WORKERS, len(items))) as executor:
+            return list(executor.map(self._save_one, items))
+
     def save_html(self, filing: Filing, content: str) -> str:
         """Save HTML content for a filing."""
-        blob_path = self._blob_path(filing, "html")
-        blob = self.bucket.blob(blob_path)
-
-        blob.upload_from_string(content, content_type="text/html")
+        if self.compress_html:
+            # Not Content-Encoding: clients that decode zstd transparently
+            # would hand load_html already-decompressed bytes
+            blob_path = self._blob_path(filing, f"html{ZSTD_SUFFIX}")
+            self._upload_bytes(
+                blob_path, _zstd_compress(content.encode("utf-8")), "application/zstd"
+            )
+        else:
+            blob_path = self._blob_path(filing, "html")
+            self._upload_bytes(blob_path, content.encode("utf-8"), "text/html")
 
         relative_path = blob_path.replace(f"{self.prefix}/", "")
         logger.debug(f"Saved HTML to gs://{self.bucket_name}/{blob_path}")
@@ -321,9 +859,21 @@ class GCSStorage(FileStorage):
     def save_pdf(self, filing: Filing, content: bytes) -> str:
         """Save PDF content for a filing."""
         blob_path = self._blob_path(filing, "pdf")
-        blob = self.bucket.blob(blob_path)
+        self._upload_bytes(blob_path, content, "application/pdf")
+
+        relative_path = blob_path.replace(f"{self.prefix}/", "")
+        logger.debug(f"Saved PDF to gs://{self.bucket_name}/{blob_path}")
+        return relative_path
+
+    def save_pdf_from_path(self, filing: Filing, local_path: str | Path) -> str:
+        """
+        Upload a PDF from local disk, streamed in chunks by the client
+        rather than held in memory.
+        """
+        blob_path = self._blob_path(filing, "pdf")
+        blob = self._upload_blob(blob_path)
 
-        blob.upload_from_string(content, content_type="application/pdf")
+        blob.upload_from_filename(str(local_path), content_type="application/pdf")
 
         relative_path = blob_path.replace(f"{self.prefix}/", "")
         logger.debug(f"Saved PDF to gs://{self.bucket_name}/{blob_path}")
@@ -331,40 +881,49 @@ class GCSStorage(FileStorage):
 
     def load_json(self, path: str) -> Optional[Dict]:
         """Load JSON from path."""
+        from google.api_core.exceptions import NotFound
+
         blob_path = self._resolve_path(path)
         blob = self.bucket.blob(blob_path)
 
-        if not blob.exists():
-            return None
+        # A missing blob surfaces as NotFound from the download itself, so
+        # loads need no separate exists() request
         try:
-            content = blob.download_as_text()
-            return json.loads(content)
+            return _deserialize_json(blob.download_as_bytes())
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(f"Error loading JSON from {blob_path}: {e}")
             return None
 
     def load_html(self, path: str) -> Optional[str]:
         """Load HTML from path."""
+        from google.api_core.exceptions import NotFound
+
         blob_path = self._resolve_path(path)
         blob = self.bucket.blob(blob_path)
 
-        if not blob.exists():
-            return None
         try:
+            if blob_path.endswith(ZSTD_SUFFIX):
+                return _zstd_decompress(blob.download_as_bytes()).decode("utf-8")
             return blob.download_as_text()
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(f"Error loading HTML from {blob_path}: {e}")
             return None
 
     def load_pdf(self, path: str) -> Optional[bytes]:
         """Load PDF from path."""
+        from google.api_core.exceptions import NotFound
+
         blob_path = self._resolve_path(path)
         blob = self.bucket.blob(blob_path)
 
-        if not blob.exists():
-            return None
         try:
             return blob.download_as_bytes()
+        except NotFound:
+            return None
         except Exception as e:
             logger.error(f"Error loading PDF from {blob_path}: {e}")
             return None
@@ -377,19 +936,21 @@ class GCSStorage(FileStorage):
 
     def delete(self, path: str) -> bool:
         """Delete a file."""
+        from google.api_core.exceptions import NotFound
+
         blob_path = self._resolve_path(path)
         blob = self.bucket.blob(blob_path)
-        if blob.exists():
+        try:
             blob.delete()
-            return True
-        return False
+        except NotFound:
+            return False
+        return True
 
     def get_filing_dir(self, filing: Filing) -> Path:
         """Get the directory for a filing (returns a Path-like for GCS)."""
         ticker = (filing.ticker or filing.cik).upper()
         # For GCS, we return a local temp directory where derivatives will be written
         # then uploaded. In practice, derivatives are written inline.
-        import tempfile
         temp_dir = Path(tempfile.gettempdir()) / "sec-derivatives" / ticker
         temp_dir.mkdir(parents=True, exist_ok=True)
         return temp_dir
@@ -408,6 +969,13 @@ def create_storage(config: Dict[str, Any]) -> FileStorage:
         data_dir: Path for local storage
         gcs_bucket: Bucket name for GCS
         gcs_data_prefix: Prefix within bucket for data files
+        parallel_upload_threshold: Bytes at which GCS uploads switch to
+            parallel composed parts (0 disables)
+        use_odirect: Write large local PDFs with O_DIRECT
+        compress_html: Store HTML zstd-compressed (.html.zst)
+        dedup_artifacts: Hardlink identical local HTML/PDF bodies to one copy
+        upload_chunk_size: Resumable GCS upload chunk size in bytes (multiple
+            of 256 KiB; unset keeps the client default)
     """
     storage_type = config.get("storage_type", "local")
 
@@ -416,7 +984,20 @@ def create_storage(config: Dict[str, Any]) -> FileStorage:
         if not bucket:
             raise ValueError("gcs_bucket is required for GCS storage")
         prefix = config.get("gcs_data_prefix", "sec-data")
-        return GCSStorage(bucket, prefix)
+        return GCSStorage(
+            bucket,
+            prefix,
+            parallel_upload_threshold=config.get(
+                "parallel_upload_threshold", DEFAULT_PARALLEL_UPLOAD_THRESHOLD
+            ),
+            compress_html=config.get("compress_html", False),
+            upload_chunk_size=config.get("upload_chunk_size"),
+        )
     else:
         data_dir = config.get("data_dir", "./data")
-        return LocalStorage(data_dir)
+        return LocalStorage(
+            data_dir,
+            use_odirect=config.get("use_odirect", False),
+            compress_html=config.get("compress_html", False),
+            dedup_artifacts=config.get("dedup_artifacts", False),
+        )
@@ -30,6 +30,7 @@ from parser_v2 import (
     Anchor,
     HTMLSanitizer,
     HTMLTextExtractor,
+    LxmlTextExtractor,
     SECTION_10K_PATTERNS,
     SECTION_10Q_PATTERNS,
     write_display_artifacts,
@@ -490,6 +491,54 @@ class TestHTMLExtraction:
         # Body Content should be present (body is not a skip tag)
         assert "Body Content" in text or "Content" in text
 
+    @pytest.mark.parametrize("html", [
+        "<div>Item 1.<br/>Business</div><p>one<p>two",
+        "<table><tr><td>Revenue<td>100<tr><td>Costs<td>60</table>",
+        "<p>Stray close</div><p>After</p>",
+    ])
+    def test_default_text_extraction_independent_of_lxml(self, html):
+        """Without opting in, installed lxml does not change extracted text."""
+        with patch("parser_v2.HAS_LXML", False):
+            without_lxml = FilingParserV2()._extract_text(html)
+        with patch("parser_v2.HAS_LXML", True):
+            parser = FilingParserV2()
+            assert parser.text_extractor == "html.parser"
+            assert parser._extract_text(html) == without_lxml
+
+    @pytest.mark.parametrize("html", [
+        "<div><p>Line one<br>Line two</p><p>A &amp; B</p></div>",
+        "<table><tr><td>Cell 1</td><td>Cell 2</td></tr></table><p>Tail</p>",
+        "<html><head><title>Title</title><style>.x{}</style></head>"
+        "<body><script>var x = 1;</script><p>Body</p></body></html>",
+    ])
+    def test_lxml_text_extractor_matches_html_parser(self, html):
+        """lxml extraction matches the html.parser extractor on well-formed markup."""
+        pytest.importorskip("lxml")
+        expected = HTMLTextExtractor()
+        expected.feed(html)
+        extractor = LxmlTextExtractor()
+        extractor.feed(html)
+
+        assert extractor.get_text() == expected.get_text()
+
+    @pytest.mark.parametrize("html, html_parser_text, lxml_text", [
+        ("<div>Item 1.<br/>Business</div>", "Item 1.\n\nBusiness", "Item 1.\nBusiness"),
+        ("<p>one<p>two", "one\ntwo", "one\n\ntwo"),
+        ("<tr><td>a<td>b</tr>", "a\nb", "a\n\nb"),
+    ])
+    def test_lxml_text_extractor_documented_differences(self, html, html_parser_text, lxml_text):
+        """Self-closed <br/> and implied ends differ, as documented on LxmlTextExtractor."""
+        pytest.importorskip("lxml")
+        assert FilingParserV2()._extract_text(html) == html_parser_text
+        assert FilingParserV2(text_extractor="lxml")._extract_text(html) == lxml_text
+
+    def test_text_extractor_option(self):
+        """Unknown extractors are rejected; lxml falls back when not installed."""
+        with pytest.raises(ValueError):
+            FilingParserV2(text_extractor="regex")
+        with patch("parser_v2.HAS_LXML", False):
+            assert FilingParserV2(text_extractor="lxml").text_extractor == "html.parser"
+
     def test_html_sanitizer_removes_scripts(self):
         """Test that sanitizer removes script tags."""
         sanitizer = HTMLSanitizer()
@@ -710,6 +759,13 @@ class TestAnchorDetection:
         for label in valid_labels:
             assert parser._is_valid_anchor_label(label) is True, f"'{label}' should be valid"
 
+    def test_garbage_filters_only_match_at_label_start(self, parser):
+        """Garbage patterns are anchored at the start of the label."""
+        assert parser._is_valid_anchor_label("PAGE 12 OF 40") is False
+        assert parser._is_valid_anchor_label("March 31, 2024") is False
+        assert parser._is_valid_anchor_label("Pages and Screens") is True
+        assert parser._is_valid_anchor_label("Revenue by Month 2024") is True
+
     def test_anchor_limit(self, parser):
         """Test that anchors are limited to 20 per section."""
         # Create text with many headers
@@ -807,6 +863,11 @@ class TestTableExtraction:
         assert text == "HO"
         assert "_" not in text
 
+    def test_plain_cells_normalized_without_tags(self, parser):
+        """Cells without markup still get whitespace normalization."""
+        assert parser._extract_cell_text("  $1,000 \t (2) ") == "$1,000 (2)"
+        assert parser._extract_cell_text("Net \n  income") == "Net\nincome"
+
     def test_br_converted_to_newline(self, parser):
         """Test that <br> tags are converted to newlines."""
         cell_html = "Line 1<br>Line 2<br/>Line 3"
@@ -1071,6 +1132,14 @@ class TestHTMLSectionExtraction:
         header_with_prose = "Item 1. Business\n\nContent here..."
         assert parser._has_prose_following(header_with_prose, 0, min_chars=10) is False
 
+    def test_has_prose_following_measures_from_position(self, parser):
+        """Distance to the next header is measured from pos, not the text start."""
+        text = "x" * 1000 + "ITEM 1. Business " + "word " * 30 + "PART II. Other"
+        pos = text.index("word")  # next header is 150 chars on
+
+        assert parser._has_prose_following(text, pos, min_chars=100) is True
+        assert parser._has_prose_following(text, pos, min_chars=200) is False
+
 
 # =============================================================================
 # End Boundary Detection Tests
@@ -1109,6 +1178,24 @@ class TestEndBoundaryDetection:
         assert end > 0
         assert end < len(html)
 
+    def test_end_boundary_offsets_are_absolute(self, parser):
+        """Boundaries searched from start_pos are reported as document offsets."""
+        prefix = "<div>" + "<p>Earlier section text.</p>" * 40 + "</div>"
+        body = "<h2>Item 1. Business</h2><p>" + "We make widgets for customers. " * 40 + "</p>"
+        html = prefix + body + "<h2>Item 1A. Risk Factors</h2><p>" + "Risks. " * 40 + "</p>"
+        start = len(prefix)
+        section_text = "We make widgets for customers. " * 40
+
+        by_label = parser._find_section_end_boundary(
+            html, start, "Item 1. Business", section_text, {"label": "Item 1A. Risk Factors"}
+        )
+        by_pattern = parser._find_section_end_boundary(
+            html, start, "Item 1. Business", section_text, None
+        )
+
+        assert by_label == html.index("<h2>Item 1A")
+        assert by_pattern == html.index("<h2>Item 1A")
+
 
 # =============================================================================
 # Output Writer Tests
@@ -1135,6 +1222,40 @@ class TestOutputWriters:
             assert manifest["filing_id"] == "TEST-10-K-2024-01-01"
             assert manifest["ticker"] == "TEST"
 
+    def test_write_display_artifacts_html_roundtrip(self, parsed_filing):
+        """Test section HTML is written as UTF-8 and replaces stale files."""
+        parsed_filing.sections[0].html = "<p>Société — €100</p>"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            section_path = output_dir / "display" / "sections" / "item_1.html"
+            section_path.parent.mkdir(parents=True)
+            section_path.write_text("x" * 1000)
+
+            write_display_artifacts(parsed_filing, output_dir)
+
+            assert section_path.read_text(encoding="utf-8") == "<p>Société — €100</p>"
+            raw = (output_dir / "display" / "raw_primary.html").read_text(encoding="utf-8")
+            assert raw == parsed_filing.raw_html
+
+    def test_write_display_artifacts_sections_archive(self, parsed_filing):
+        """Test section HTML can be written to a single zip archive."""
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            paths = write_display_artifacts(parsed_filing, output_dir, sections_archive=True)
+
+            archive_path = output_dir / "display" / "sections.zip"
+            assert paths["sections_archive"] == archive_path
+            assert not (output_dir / "display" / "sections").exists()
+
+            with zipfile.ZipFile(archive_path) as zf:
+                assert sorted(zf.namelist()) == sorted(
+                    f"{s.id}.html" for s in parsed_filing.sections
+                )
+                for section in parsed_filing.sections:
+                    assert zf.read(f"{section.id}.html").decode("utf-8") == section.html
+
     def test_write_rag_artifacts(self, parsed_filing):
         """Test writing RAG artifacts."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1760,6 +1881,25 @@ class TestAnchorEdgeCases:
         # "12345" has 0% alpha, should fail
         assert parser._is_valid_anchor_label("12345") is False
 
+    def test_anchor_with_non_ascii_letters(self, parser):
+        """Test that accented letters count as alphabetic."""
+        assert parser._is_valid_anchor_label("Société Générale") is True
+        assert parser._is_valid_anchor_label("É 12345678") is False
+
+    def test_title_case_counts_word_initial_capitals_only(self, parser):
+        """Test that capitals after hyphens or parentheses don't make Title Case."""
+        section = Section(
+            id="item_7",
+            label="Item 7",
+            html="",
+            text="Intro!\nNon-Recurring (Loss) items\nRevenue grew 5%.\nSegment Operating Results\nEnd!",
+            char_start=0,
+            char_end=0,
+        )
+        labels = [a.label for a in parser._find_anchors(section)]
+        assert "Segment Operating Results" in labels
+        assert "Non-Recurring (Loss) items" not in labels
+
 
 class TestTableNoHeaders:
     """Test table extraction edge cases."""
@@ -1910,6 +2050,27 @@ class TestTextToHtmlWithTablesDetailed:
         # Should still produce HTML even if matching fails
         assert result is not None
 
+    def test_tables_tokenized_once_per_document(self, parser):
+        """Test that sections falling back to text-to-HTML share one table scan."""
+        import parser_v2
+
+        html = """
+        <table><tr><td>Segment Revenue</td><td>$10M</td></tr></table>
+        <table><tr><td>Operating Income</td><td>$4M</td></tr></table>
+        """
+        text = "Segment Revenue $10M\nOperating Income $4M"
+        # Labels absent from the HTML force the text-to-HTML fallback
+        positions = [
+            {"id": "item_7", "label": "Item 7. Missing", "start": 0},
+            {"id": "item_8", "label": "Item 8. Missing", "start": text.index("Operating")},
+        ]
+        with patch('parser_v2._document_tables', wraps=parser_v2._document_tables) as scan:
+            sections = parser._extract_sections(html, text, positions)
+
+        assert scan.call_count == 1
+        assert "Segment Revenue" in sections[0].html and "<table>" in sections[0].html
+        assert "Operating Income" in sections[1].html and "<table>" in sections[1].html
+
 
 class TestDOMExtractionEdgeCases:
     """Edge cases for DOM extraction."""
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SEC filing state.
+
+Tests cover:
+- Local filing claims (released on failure, abandoned claims taken over)
+"""
+
+import os
+import socket
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from models import Filing, FilingStatus
+from state import LocalStateStore
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def make_filing() -> Filing:
+    return Filing(
+        cik="0000320193",
+        ticker="AAPL",
+        company_name="Apple Inc.",
+        accession_number="0000320193-24-000001",
+        form_type="10-K",
+        filed_at=datetime(2024, 11, 1),
+        accepted_at=None,
+        period_of_report=None,
+        status=FilingStatus.DISCOVERED,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStateStore(tmp_path / "state")
+    store.upsert_filing(make_filing())
+    return store
+
+
+def write_claim(store: LocalStateStore, filing: Filing, owner: str):
+    path = store._claim_path(filing.cik, filing.accession_number)
+    path.write_text(owner + "\n")
+    return path
+
+
+def dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+# =============================================================================
+# Claim Tests
+# =============================================================================
+
+class TestClaimFiling:
+    """Test cross-process filing claims in LocalStateStore."""
+
+    def test_claim_released_when_status_write_fails(self, store):
+        """A failed DOWNLOADING upsert releases the claim so the filing is retried."""
+        filing = make_filing()
+        with patch.object(store, "upsert_filing", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                store.claim_filing(filing)
+
+        assert not store._claim_path(filing.cik, filing.accession_number).exists()
+        assert filing.status == FilingStatus.DISCOVERED
+        assert store.claim_filing(make_filing())
+
+    def test_live_claim_is_respected(self, store):
+        """A fresh claim held by a running process blocks other claimers."""
+        filing = make_filing()
+        write_claim(store, filing, f"{os.getpid()} {socket.gethostname()}")
+
+        assert not store.claim_filing(filing)
+
+    def test_claim_of_dead_process_is_taken_over(self, store):
+        """A claim left by a PID that no longer exists is taken over."""
+        filing = make_filing()
+        path = write_claim(store, filing, f"{dead_pid()} {socket.gethostname()}")
+
+        assert store.claim_filing(filing)
+        assert path.read_text().split()[0] == str(os.getpid())
+        assert store.get_filing(filing.cik, filing.accession_number).status == FilingStatus.DOWNLOADING
+
+    def test_expired_claim_is_taken_over(self, store):
+        """A claim older than claim_timeout is taken over even if its owner is alive."""
+        filing = make_filing()
+        path = write_claim(store, filing, f"{os.getpid()} {socket.gethostname()}")
+        expired = path.stat().st_mtime - store.claim_timeout - 60
+        os.utime(path, (expired, expired))
+
+        assert store.claim_filing(filing)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SEC filing storage.
+
+Tests cover:
+- Local artifact deduplication (shared objects must never be written into)
+"""
+
+import hashlib
+import os
+from datetime import datetime
+
+import pytest
+
+from models import Filing
+from storage import LocalStorage, OBJECTS_DIR_NAME
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def make_filing(ticker: str) -> Filing:
+    """Filing for `ticker` that shares CIK, form and date with its siblings."""
+    return Filing(
+        cik="0001652044",
+        ticker=ticker,
+        company_name="Alphabet Inc.",
+        accession_number="0001652044-24-000001",
+        form_type="10-K",
+        filed_at=datetime(2024, 1, 31),
+        accepted_at=None,
+        period_of_report=None,
+    )
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    return tmp_path / "data"
+
+
+def object_path(data_dir, content: bytes):
+    digest = hashlib.sha256(content).hexdigest()
+    return data_dir / OBJECTS_DIR_NAME / digest[:2] / digest
+
+
+# =============================================================================
+# Deduplication Tests
+# =============================================================================
+
+class TestDedupArtifacts:
+    """Test hardlink deduplication of local HTML/PDF artifacts."""
+
+    def test_identical_pdfs_share_one_object(self, data_dir):
+        """Identical bodies for two tickers are one inode in the object store."""
+        storage = LocalStorage(data_dir, dedup_artifacts=True)
+        goog = storage.save_pdf(make_filing("GOOG"), b"SAME")
+        googl = storage.save_pdf(make_filing("GOOGL"), b"SAME")
+
+        assert os.path.samefile(data_dir / goog, data_dir / googl)
+        assert os.path.samefile(data_dir / goog, object_path(data_dir, b"SAME"))
+
+    @pytest.mark.parametrize("dedup", [True, False])
+    def test_save_pdf_from_path_does_not_write_into_shared_object(self, data_dir, tmp_path, dedup):
+        """A new render for one ticker leaves the other ticker and the object intact."""
+        shared = LocalStorage(data_dir, dedup_artifacts=True)
+        goog = shared.save_pdf(make_filing("GOOG"), b"SAME")
+        googl = shared.save_pdf(make_filing("GOOGL"), b"SAME")
+        rendered = tmp_path / "render.pdf"
+        rendered.write_bytes(b"NEWRENDER")
+
+        storage = LocalStorage(data_dir, dedup_artifacts=dedup)
+        storage.save_pdf_from_path(make_filing("GOOG"), rendered)
+
+        assert (data_dir / goog).read_bytes() == b"NEWRENDER"
+        assert (data_dir / googl).read_bytes() == b"SAME"
+        assert object_path(data_dir, b"SAME").read_bytes() == b"SAME"
+        if dedup:
+            assert os.path.samefile(data_dir / goog, object_path(data_dir, b"NEWRENDER"))
+
+    def test_plain_writes_replace_hardlinked_files(self, data_dir):
+        """With dedup turned off again, saves unlink shared files before writing."""
+        LocalStorage(data_dir, dedup_artifacts=True).save_html(make_filing("GOOG"), "<p>same</p>")
+        googl = LocalStorage(data_dir, dedup_artifacts=True).save_html(make_filing("GOOGL"), "<p>same</p>")
+
+        LocalStorage(data_dir).save_html(make_filing("GOOG"), "<p>changed</p>")
+
+        assert (data_dir / googl).read_text(encoding="utf-8") == "<p>same</p>"
+        assert object_path(data_dir, b"<p>same</p>").read_bytes() == b"<p>same</p>"